@@ -0,0 +1,17 @@
+"""matplotlib backend of the example scripts."""
+
+import os
+import sys
+
+import matplotlib
+
+
+def use_backend():
+    """Use the TkAgg GUI backend when a display is available.
+
+    Headless runs (CI, profiling) of the examples render with Agg.
+    """
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        matplotlib.use("Agg")
+    else:
+        matplotlib.use("TkAgg")
@@ -1,29 +1,30 @@
 """Extreme value statistics"""
 
-import matplotlib
+from backend import use_backend
 
-matplotlib.use("TkAgg")
-import pandas as pd
+use_backend()
+import matplotlib.pyplot as plt
+import numpy as np
 
 from statista.distributions import GEV, Gumbel, PlottingPosition, Distributions
 from statista.confidence_interval import ConfidenceInterval
 
-time_series1 = pd.read_csv("examples/data/time_series1.txt", header=None)[0].tolist()
-time_series2 = pd.read_csv("examples/data/time_series2.txt", header=None)[0].tolist()
+time_series1 = np.loadtxt("examples/data/time_series1.txt", dtype=np.float64)
+time_series2 = np.loadtxt("examples/data/time_series2.txt", dtype=np.float64)
 # %%
 gumbel_series_1 = Distributions("Gumbel", time_series1)
 # defult parameter estimation method is maximum liklihood method
 param_mle = gumbel_series_1.fit_model(method="mle")
-gumbel_series_1.ks()
-gumbel_series_1.chisquare()
+gumbel_series_1.ks(verbose=True)
+gumbel_series_1.chisquare(verbose=True)
 print(param_mle)
 # calculate and plot the pdf
 pdf = gumbel_series_1.pdf(plot_figure=True)
 cdf, _, _ = gumbel_series_1.cdf(plot_figure=True)
 # %% lmoments
 param_lmoments = gumbel_series_1.fit_model(method="lmoments")
-gumbel_series_1.ks()
-gumbel_series_1.chisquare()
+gumbel_series_1.ks(verbose=True)
+gumbel_series_1.chisquare(verbose=True)
 print(param_lmoments)
 # calculate and plot the pdf
 pdf = gumbel_series_1.pdf(plot_figure=True)
@@ -58,8 +59,8 @@ gumbel_series_1.plot(parameters=param_dist)
 gev_series_2 = Distributions("GEV", time_series2)
 # default parameter estimation method is maximum likelihood method
 gev_mle_param = gev_series_2.fit_model(method="mle")
-gev_series_2.ks()
-gev_series_2.chisquare()
+gev_series_2.ks(verbose=True)
+gev_series_2.chisquare(verbose=True)
 
 print(gev_mle_param)
 # calculate and plot the pdf
@@ -71,6 +72,12 @@ print(gev_lmom_param)
 # calculate and plot the pdf
 pdf, fig, ax = gev_series_2.pdf(plot_figure=True)
 cdf, _, _ = gev_series_2.cdf(plot_figure=True)
+# %% draw the pdf and the cdf on the axes of one figure with the `ax` argument
+fig, (ax_pdf, ax_cdf) = plt.subplots(1, 2, figsize=(12, 5))
+gev_series_2.pdf(plot_figure=True, ax=ax_pdf)
+gev_series_2.cdf(plot_figure=True, ax=ax_cdf)
+fig.tight_layout()
+plt.show()
 # %%
 
 # calculate the F (Non-Exceedance probability based on weibul)
@@ -97,6 +104,7 @@ CI = ConfidenceInterval.boot_strap(
     n_samples=100,
     F=cdf_weibul,
     method="lmoments",
+    seed=1,
 )
 lower_bound = CI["lb"]
 upper_bound = CI["ub"]
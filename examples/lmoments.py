@@ -1,9 +1,8 @@
-import pandas as pd
 import numpy as np
 from statista.parameters import Lmoments
 
-time_series1 = pd.read_csv("examples/data/time_series1.txt", header=None)[0].tolist()
-time_series2 = pd.read_csv("examples/data/time_series2.txt", header=None)[0].tolist()
+time_series1 = np.loadtxt("examples/data/time_series1.txt", dtype=np.float64)
+time_series2 = np.loadtxt("examples/data/time_series2.txt", dtype=np.float64)
 # %%
 L = Lmoments(time_series1)
 l1, l2, l3, l4 = L.Lmom(4)
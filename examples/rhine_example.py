@@ -1,8 +1,8 @@
 """ Rhine gauges example """
 
-import matplotlib
+from backend import use_backend
 
-matplotlib.use("TkAgg")
+use_backend()
 import numpy as np
 import pandas as pd
 from statista.distributions import (
@@ -23,8 +23,8 @@ rockenau_gauge = ams.loc[:, "rockenau"].values
 dist_obj = Distributions("Exponential", cologne_gauge)
 # default parameter estimation method is maximum liklihood method
 mle_param = dist_obj.fit_model(method="mle")
-dist_obj.ks()
-dist_obj.chisquare()
+dist_obj.ks(verbose=True)
+dist_obj.chisquare(verbose=True)
 
 print(mle_param)
 # calculate and plot the pdf
@@ -34,8 +34,8 @@ cdf, _, _ = dist_obj.cdf(plot_figure=True)
 dist_obj = Distributions("Exponential", cologne_gauge)
 # default parameter estimation method is maximum likelihood method
 mle_param = dist_obj.fit_model(method="lmoments")
-dist_obj.ks()
-dist_obj.chisquare()
+dist_obj.ks(verbose=True)
+dist_obj.chisquare(verbose=True)
 
 print(mle_param)
 # calculate and plot the pdf
@@ -45,8 +45,8 @@ cdf, _, _ = dist_obj.cdf(plot_figure=True)
 gev_cologne = Distributions("GEV", cologne_gauge)
 # default parameter estimation method is maximum likelihood method
 mle_param = gev_cologne.fit_model(method="mle")
-gev_cologne.ks()
-gev_cologne.chisquare()
+gev_cologne.ks(verbose=True)
+gev_cologne.chisquare(verbose=True)
 
 print(mle_param)
 # shape = -1 * mle_param[0]
@@ -57,8 +57,8 @@ cdf, _, _ = gev_cologne.cdf(plot_figure=True)
 gev_cologne = Distributions("GEV", cologne_gauge)
 # default parameter estimation method is maximum likelihood method
 lmom_param = gev_cologne.fit_model(method="lmoments")
-gev_cologne.ks()
-gev_cologne.chisquare()
+gev_cologne.ks(verbose=True)
+gev_cologne.chisquare(verbose=True)
 
 print(lmom_param)
 # shape = -1 * `lmom_param[0]
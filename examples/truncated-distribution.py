@@ -1,17 +1,17 @@
-import matplotlib
+from backend import use_backend
 
-matplotlib.use("TkAgg")
-import pandas as pd
+use_backend()
+import numpy as np
 
 from statista.distributions import Gumbel, PlottingPosition, Distributions
 
-time_series1 = pd.read_csv("examples/data/time_series1.txt", header=None)[0].tolist()
-time_series2 = pd.read_csv("examples/data/time_series2.txt", header=None)[0].tolist()
+time_series1 = np.loadtxt("examples/data/time_series1.txt", dtype=np.float64)
+time_series2 = np.loadtxt("examples/data/time_series2.txt", dtype=np.float64)
 # %%
 gumbel_series_1 = Distributions("Gumbel", time_series1)
 param_lmoments = gumbel_series_1.fit_model(method="lmoments")
-gumbel_series_1.ks()
-gumbel_series_1.chisquare()
+gumbel_series_1.ks(verbose=True)
+gumbel_series_1.chisquare(verbose=True)
 print(param_lmoments)
 # calculate and plot the pdf
 pdf = gumbel_series_1.pdf(plot_figure=True)
@@ -21,7 +21,6 @@ upper, lower, fig, ax = gumbel_series_1.confidence_interval(alpha=0.1, plot_figu
 # calculate the F (Non-Exceedance probability based on weibul)
 cdf_weibul = PlottingPosition.weibul(time_series1)
 # %%
-import numpy as np
 
 
 def truncated_distribution(p, x, threshold):
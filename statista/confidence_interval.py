@@ -1,10 +1,43 @@
 """Confidence interval module."""
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import inspect
+import os
 from loguru import logger
-from typing import Union
-from numpy.random import randint
+from typing import Callable, Union
 import numpy as np
+from scipy.stats import bootstrap
+
+
+def _accepts_rng(state_function: Callable) -> bool:
+    """check if the state function accepts a `rng` keyword argument (explicitly or through **kwargs)."""
+    try:
+        parameters = inspect.signature(state_function).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        par.name == "rng" or par.kind == inspect.Parameter.VAR_KEYWORD
+        for par in parameters
+    )
+
+
+# the seed keyword of `scipy.stats.bootstrap` is `rng` from scipy 1.15, older versions only accept `random_state`.
+_BOOTSTRAP_SEED_KW = (
+    "rng" if "rng" in inspect.signature(bootstrap).parameters else "random_state"
+)
+
+
+def _bootstrap_indexes(n: int, n_samples: int, rng: np.random.Generator) -> np.ndarray:
+    """(n_samples, n) matrix of random indexes drawn in one call, each row holds the indexes of one sample."""
+    return rng.integers(0, n, size=(n_samples, n), dtype=np.int64)
+
+
+def _call_with_rng(func: Callable, item):
+    """evaluate the state function on a (sample, rng) pair."""
+    sample, rng = item
+    return func(sample, rng=rng)
 
 
 class ConfidenceInterval:
@@ -14,7 +47,9 @@ class ConfidenceInterval:
         pass
 
     @staticmethod
-    def bs_indexes(data, n_samples=10000) -> np.ndarray:
+    def bs_indexes(
+        data, n_samples=10000, seed: Union[int, np.random.SeedSequence] = None
+    ) -> np.ndarray:
         """bs_indexes.
 
             - generate random indeces to shuffle the data of the given array.
@@ -26,6 +61,16 @@ class ConfidenceInterval:
         This can be used as a list of bootstrap indexes (with
         list(bootstrap_indexes(data))) as well.
 
+        Parameters
+        ----------
+        data: [list, np.ndarray]
+            data to be resampled.
+        n_samples: int, Default is 10000.
+            number of sets of indexes.
+        seed: [int, np.random.SeedSequence], optional, default is None.
+            seed of the `np.random.Generator` used to draw the indexes (the same generator as `boot_strap`), None
+            draws fresh entropy from the OS.
+
         Returns
         -------
         np.ndarray
@@ -34,14 +79,14 @@ class ConfidenceInterval:
         Examples
         --------
         >>> data = [3.1, 2.4, 5.6, 8.4]
-        >>> indeces = ConfidenceInterval.bs_indexes(data, n_samples=2)
-        >>> print(indeces)
-        >>> [1, 4, 4, 3]
-        >>> print(indeces)
-        >>> [2, 3, 1, 2]
+        >>> indeces = list(ConfidenceInterval.bs_indexes(data, n_samples=2, seed=0))
+        >>> print(len(indeces), indeces[0].shape)
+        2 (4,)
         """
-        for _ in range(n_samples):
-            yield randint(data.shape[0], size=(data.shape[0],))
+        # draw all the indexes in one call instead of one call per sample.
+        yield from _bootstrap_indexes(
+            np.shape(data)[0], n_samples, np.random.default_rng(seed)
+        )
 
     @staticmethod
     def boot_strap(
@@ -49,6 +94,8 @@ class ConfidenceInterval:
         state_function: callable,
         alpha: float = 0.05,
         n_samples: int = 100,
+        workers: Union[int, Callable] = 1,
+        seed: Union[int, np.random.SeedSequence] = None,
         **kwargs,
     ):  # ->  Dict[str, OrderedDict[str, Tuple[Any, Any]]]
         """boot_strap
@@ -70,6 +117,20 @@ class ConfidenceInterval:
             number of samples to be generated. .
         alpha: numeric, optional, default is 0.05
                 alpha or SignificanceLevel is a value of the confidence interval.
+        workers: [int, callable], optional, default is 1.
+            the bootstrap samples are independent, so the `state_function` can be evaluated in parallel.
+
+            - 1: the samples are evaluated serially in the current process.
+            - int > 1: number of worker processes, -1 uses all the available cores. the `state_function` and the
+                kwargs have to be picklable (e.g. `GEV.ci_func`), the random generator of each worker is seeded
+                independently.
+            - map-like callable: used as `workers(func, iterable)` to evaluate the samples (e.g.
+                `multiprocessing.Pool.map`).
+        seed: [int, np.random.SeedSequence], optional, default is None.
+            seed of the `np.random.Generator` used to draw the bootstrap samples. each sample gets an independent
+            generator spawned from it, which is passed to the `state_function` as the `rng` keyword argument if it
+            accepts it (e.g. `GEV.ci_func`), so the results are reproducible for a given seed whatever the number of
+            workers. None draws fresh entropy from the OS.
         kwargs:
             gevfit: [list]
                 list of the three parameters of the GEV distribution [shape, loc, scale]
@@ -82,16 +143,37 @@ class ConfidenceInterval:
         alphas = np.array([alpha / 2, 1 - alpha / 2])
         tdata = (np.array(data),)
 
-        # We don't need to generate actual samples; that would take more memory.
-        # Instead, we can generate just the indexes, and then apply the stat-fun
-        # to those indexes.
-        boot_indexes = ConfidenceInterval.bs_indexes(tdata[0], n_samples)
-        stat = np.array(
-            [
-                state_function(*(x[indexes] for x in tdata), **kwargs)
-                for indexes in boot_indexes
-            ]
-        )
+        # generate the (n_samples, n) index matrix in one call and gather all the resamples at once, each row
+        # is one bootstrap sample.
+        n = tdata[0].shape[0]
+        rng = np.random.default_rng(seed)
+        samples = tdata[0][_bootstrap_indexes(n, n_samples, rng)]
+        func = partial(state_function, **kwargs)
+        if _accepts_rng(state_function):
+            # one independent random stream per sample.
+            func = partial(_call_with_rng, func)
+            samples = list(zip(samples, rng.spawn(n_samples)))
+
+        if callable(workers):
+            stat = np.array(list(workers(func, samples)))
+        elif workers == 1:
+            stat = np.array([func(sample) for sample in samples])
+        else:
+            max_workers = os.cpu_count() if workers == -1 else workers
+            # forked workers inherit the legacy random state of the parent process, so each worker is re-seeded
+            # from fresh entropy for the state functions that do not take a `rng`.
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=np.random.seed
+            ) as executor:
+                stat = np.array(
+                    list(
+                        executor.map(
+                            func,
+                            samples,
+                            chunksize=max(1, n_samples // (4 * max_workers)),
+                        )
+                    )
+                )
         stat.sort(axis=0)
 
         # Percentile Interval Method
@@ -132,3 +214,66 @@ class ConfidenceInterval:
         params["scale"] = (out[0, 2], out[1, 3])
 
         return {"lb": lb, "ub": ub, "params": params}
+
+    @staticmethod
+    def scipy_boot_strap(
+        data: Union[list, np.ndarray],
+        statistic: Callable,
+        alpha: float = 0.05,
+        n_samples: int = 9999,
+        method: str = "BCa",
+        vectorized: bool = None,
+        seed: Union[int, np.random.Generator] = None,
+    ):
+        """scipy_boot_strap.
+
+        Non-parametric bootstrap confidence interval of a statistic of the data, the resampling and the interval
+        (percentile, basic or BCa) are delegated to `scipy.stats.bootstrap`.
+
+        Use this method for a statistic computed from the resampled data (e.g. a quantile or the mean), the
+        parametric bootstrap of the GEV quantiles (`GEV.ci_func`) uses `boot_strap`.
+
+        Parameters
+        ----------
+        data: [list, np.ndarray]
+            data to be used to calculate the confidence interval.
+        statistic: [callable]
+            statistic of the data, `statistic(sample)` returns a scalar or a 1D array. If it accepts an `axis`
+            argument (e.g. `np.mean`), the resamples are evaluated in batches.
+        alpha: numeric, optional, default is 0.05
+            alpha or SignificanceLevel is a value of the confidence interval.
+        n_samples: int, Default is 9999.
+            number of bootstrap samples.
+        method: [str], optional, default is "BCa".
+            confidence interval method ["percentile", "basic", "BCa"].
+        vectorized: [bool], optional, default is None.
+            True if the statistic takes an `axis` argument, None lets scipy detect it from the signature.
+        seed: [int, np.random.Generator], optional, default is None.
+            seed of the random generator used to draw the samples.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]:
+            {"lb": lower bound, "ub": upper bound, "standard_error": bootstrap standard error}
+
+        Examples
+        --------
+        >>> data = np.random.default_rng(0).gumbel(10, 2, size=50)
+        >>> ci = ConfidenceInterval.scipy_boot_strap(data, np.mean, alpha=0.1, seed=1)
+        >>> print(ci["lb"] < np.mean(data) < ci["ub"])
+        True
+        """
+        res = bootstrap(
+            (np.asarray(data, dtype=np.float64),),
+            statistic,
+            n_resamples=n_samples,
+            vectorized=vectorized,
+            confidence_level=1 - alpha,
+            method=method,
+            **{_BOOTSTRAP_SEED_KW: seed},
+        )
+        return {
+            "lb": res.confidence_interval.low,
+            "ub": res.confidence_interval.high,
+            "standard_error": res.standard_error,
+        }
@@ -1,6 +1,8 @@
 """Statistical distributions."""
 
+from functools import lru_cache
 from numbers import Number
+import warnings
 from typing import Any, List, Tuple, Union, Dict, Callable
 from abc import ABC, abstractmethod
 import numpy as np
@@ -10,15 +12,197 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 
 from numpy import ndarray
-from scipy.stats import chisquare, genextreme, gumbel_r, ks_2samp, norm, expon
+from scipy.special import logsumexp, ndtr, ndtri
+from scipy.stats import chisquare, genextreme, gumbel_r, ks_2samp, expon
 
 from statista.parameters import Lmoments
-from statista.tools import Tools as st
 from statista.plot import Plot
 from statista.confidence_interval import ConfidenceInterval
 
 
 ninf = 1e-5
+# penalty added to the negative log-likelihood for each value outside the support of the distribution (the same
+# value scipy uses in `rv_continuous._penalized_nnlf`).
+_OUT_OF_SUPPORT_PENALTY = 100 * np.log(np.finfo(np.float64).max)
+# GEV shape parameters smaller than this (in absolute value) are evaluated with the Gumbel equations, the
+# difference between the two is of the order of shape * z**2.
+_GUMBEL_SHAPE_TOL = 1e-8
+# parameter estimation methods accepted by `fit_model`.
+_FIT_METHODS = frozenset({"mle", "mm", "lmoments", "optimization"})
+
+
+def _float_array(data: Union[list, np.ndarray]) -> ndarray:
+    """Convert the data to a floating point array, float32 arrays are kept in float32 otherwise float64 is used."""
+    data = np.asarray(data)
+    if data.dtype != np.float32:
+        data = data.astype(np.float64, copy=False)
+    return data
+
+
+@lru_cache(maxsize=128)
+def _norm_ppf_half(alpha: float) -> float:
+    """Two-sided standard normal critical value norm.ppf(1 - alpha / 2), computed once for each alpha."""
+    return float(ndtri(1 - alpha / 2))
+
+
+# largest sample size for which the exact two-sample KS p-value is computed (the same limit as scipy).
+_KS_MAX_EXACT_N = 10000
+
+
+def _ks_2samp_sorted(x_sorted: np.ndarray, y_sorted: np.ndarray) -> Tuple[float, float]:
+    """Two-sided two-sample Kolmogorov-Smirnov test for already sorted samples.
+
+    The statistic is the largest difference between the counts of the two empirical cdfs at the values of both
+    samples (two binary searches instead of sorting the samples again). For samples of the same size (the data and
+    its theoretical quantiles) the exact p-value has a closed form and is computed directly, the same way as
+    `scipy.stats.ks_2samp` does; other cases are passed to `ks_2samp`.
+
+    Returns
+    -------
+    Tuple[float, float]:
+        statistic, p-value
+    """
+    n = x_sorted.size
+    if n == 0 or n != y_sorted.size or n > _KS_MAX_EXACT_N:
+        test = ks_2samp(x_sorted, y_sorted)
+        return test.statistic, test.pvalue
+
+    data_all = np.concatenate([x_sorted, y_sorted])
+    h = int(
+        np.abs(
+            np.searchsorted(x_sorted, data_all, side="right")
+            - np.searchsorted(y_sorted, data_all, side="right")
+        ).max()
+    )
+    if h == 0:
+        return np.float64(0.0), np.float64(1.0)
+    # Pr(D >= h/n) = 2 * (A0 - A0*A1 + A0*A1*A2 - ...), Ak = binom(2n, n - k h) / binom(2n, n), evaluated with a
+    # Horner-like scheme to avoid the subtractive cancellation.
+    prob = 0.0
+    for k in range(n // h, -1, -1):
+        p1 = 1.0
+        for j in range(h):
+            p1 = (n - k * h - j) * p1 / (n + k * h + j + 1)
+        prob = p1 * (1.0 - prob)
+    return np.float64(h / n), np.clip(2 * prob, 0, 1)
+
+
+def _plot_grid(data: np.ndarray, npoints: int = None) -> np.ndarray:
+    """Grid of values between the smallest value and 1.5 times the largest value to plot the fitted distribution on.
+
+    The data does not have to be sorted, the bounds are taken with two linear reductions so callers that only need
+    the grid (e.g. `plot` with a given cdf) do not pay for a sort.
+    For positive data the points are log-spaced, so they are denser on the lower side where the density changes faster.
+    """
+    if npoints is None:
+        # at most the 10000 points of the former fixed grid, the grids are kept in the cache of `_grid_between`.
+        npoints = min(max(200, 4 * len(data)), 10000)
+    return _grid_between(float(np.min(data)), 1.5 * float(np.max(data)), int(npoints))
+
+
+@lru_cache(maxsize=32)
+def _grid_between(lower: float, upper: float, npoints: int) -> np.ndarray:
+    """Plotting grid between two bounds, computed once for each (lower, upper, npoints).
+
+    The grid is shared between the calls, so it is read-only; the pdf/cdf kernels write their results into a new
+    array and never modify it.
+    """
+    if 0 < lower < upper:
+        grid = np.geomspace(lower, upper, npoints)
+    else:
+        grid = np.linspace(lower, upper, npoints)
+    grid.setflags(write=False)
+    return grid
+
+
+def _standardize(data: Union[list, np.ndarray], loc: float, scale: float) -> ndarray:
+    """(data - loc) / scale as a new array in the floating point type of the data.
+
+    The result is a fresh array, so the pdf/cdf equations can evaluate the rest of the expression in place on it
+    instead of allocating a temporary array for every operation.
+    """
+    data = _float_array(data)
+    ftype = data.dtype.type
+    z = np.asarray(data - ftype(loc))
+    z /= ftype(scale)
+    return z
+
+
+def _gumbel_mle(data: np.ndarray, scale: float) -> List[float]:
+    """Maximum likelihood estimates [loc, scale] of the Gumbel distribution.
+
+    The likelihood equations reduce to a scalar equation in the scale,
+    scale = mean(x) - sum(x exp(-x/scale)) / sum(exp(-x/scale)), which is solved with brentq starting from a bracket
+    around the given scale, then the location has a closed form. These are the same steps as `gumbel_r.fit`, without
+    the input checks and the dispatch of the generic fit, so the estimates agree with it to floating-point precision.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        float64 data.
+    scale: float
+        initial guess of the scale parameter (e.g. the L-moments estimate).
+    """
+    data_mean = data.mean()
+
+    def func(scale_i: float) -> float:
+        # weighted average of the data with the weights exp(-x/scale) scaled by the largest weight.
+        log_weights = -data / scale_i
+        weights = np.exp(log_weights - log_weights.max())
+        return data_mean - np.multiply(data, weights).sum() / weights.sum() - scale_i
+
+    lbrack, rbrack = scale / 2, scale * 2
+    while np.sign(func(lbrack)) == np.sign(func(rbrack)) and (
+        lbrack > 0 or rbrack < np.inf
+    ):
+        lbrack /= 2
+        rbrack *= 2
+
+    scale = so.brentq(func, lbrack, rbrack, xtol=1e-14, rtol=1e-14)
+    loc = -scale * (logsumexp(-data / scale) - np.log(data.size))
+    return [float(loc), float(scale)]
+
+
+def _gev_lmoments_start(data: np.ndarray) -> Union[List[float], None]:
+    """L-moments estimates [shape, loc, scale] of the GEV distribution used to start the mle/mm fits.
+
+    None if they can not be computed (fewer than 3 values or constant data).
+    """
+    try:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x0 = Lmoments.gev(Lmoments(data).Lmom(3))
+    except ValueError:
+        return None
+    return x0 if np.all(np.isfinite(x0)) else None
+
+
+def _expon_mle(data: np.ndarray) -> List[float]:
+    """Maximum likelihood estimates [loc, scale] of the exponential distribution, loc = min(x), scale = mean(x) - loc.
+
+    The same closed form as `expon.fit`, without its generic input checks.
+    """
+    loc = data.min()
+    return [float(loc), float(data.mean() - loc)]
+
+
+def _expon_mm(data: np.ndarray) -> List[float]:
+    """Method of moments estimates [loc, scale] of the exponential distribution.
+
+    The mean is loc + scale and the variance scale**2, so scale = std(x) and loc = mean(x) - scale.
+    """
+    scale = data.std()
+    return [float(data.mean() - scale), float(scale)]
+
+
+def _norm_mle(data: np.ndarray) -> List[float]:
+    """Maximum likelihood estimates [loc, scale] of the normal distribution, the mean and the standard deviation.
+
+    The same closed form as `norm.fit`, without its generic input checks. The method of moments gives the same
+    estimates.
+    """
+    loc = data.mean()
+    return [float(loc), float(np.sqrt(((data - loc) ** 2).mean()))]
+
 
 __all__ = [
     "PlottingPosition",
@@ -62,14 +246,20 @@ class PlottingPosition:
               8.06500888 10.56043917 18.28884687  1.10298241  1.2113997   1.40988022
               1.02795867  1.01326322  1.05572108]
         """
-        if any(prob_non_exceed > 1):
+        prob_non_exceed = np.asarray(prob_non_exceed, dtype=np.float64)
+        if prob_non_exceed.size and prob_non_exceed.max() > 1:
             raise ValueError("Non-exceedance probability should be less than 1")
-        prob_non_exceed = np.array(prob_non_exceed)
-        t = 1 / (1 - prob_non_exceed)
+        # t = 1 / (1 - prob_non_exceed) with a single allocation.
+        t = np.asarray(np.subtract(1.0, prob_non_exceed))
+        np.reciprocal(t, out=t)
         return t
 
     @staticmethod
-    def weibul(data: Union[list, np.ndarray], return_period: int = False) -> np.ndarray:
+    def weibul(
+        data: Union[list, np.ndarray],
+        return_period: int = False,
+        dtype: type = np.float64,
+    ) -> np.ndarray:
         """Weibul.
 
         Weibul method to calculate the cumulative distribution function cdf or
@@ -82,11 +272,14 @@ class PlottingPosition:
         return_period : [bool]
             False to calculate the cumulative distribution function cdf or
             True to calculate the return period. Default=False
+        dtype: [type], optional, default is np.float64.
+            floating point type of the result, np.float32 halves the memory for large data that is only plotted.
 
         Returns
         -------
-        cdf/T: [list]
-            list of cumulative distribution function or return period.
+        cdf/T: [np.ndarray]
+            array of cumulative distribution function or return period, ordered
+            by the rank of the data (ascending).
 
         Examples
         --------
@@ -96,26 +289,65 @@ class PlottingPosition:
         [0.09090909 0.18181818 0.27272727 0.36363636 0.45454545 0.54545455
          0.63636364 0.72727273 0.81818182 0.90909091]
         """
-        data = np.array(data)
-        data.sort()
-        n = len(data)
-        cdf = np.array(range(1, n + 1)) / (n + 1)
+        # the plotting position of the i-th smallest value is i / (n + 1), it depends only on the rank, so the data
+        # does not need to be sorted.
+        n = np.size(data)
         if not return_period:
+            cdf = np.arange(1, n + 1, dtype=dtype)
+            cdf /= n + 1
             return cdf
         else:
-            t = PlottingPosition.return_period(cdf)
+            # T = 1 / (1 - i / (n + 1)) = (n + 1) / (n + 1 - i), without building the cdf first.
+            t = np.arange(n, 0, -1, dtype=dtype)
+            np.divide(n + 1, t, out=t)
             return t
 
+    @staticmethod
+    def reduced_variate(cdf: Union[list, np.ndarray]) -> np.ndarray:
+        """Gumbel reduced variate.
+
+        The reduced variate y = -log(-log(F)) of the non-exceedance probability, the quantile functions of the Gumbel
+        and GEV distributions are functions of y, so it can be computed once for a given cdf and reused.
+
+        Parameters
+        ----------
+        cdf: [list/array]
+            non-exceedance probability.
+
+        Returns
+        -------
+        array:
+            reduced variate, cdf = 0 and cdf = 1 map to -inf and inf.
+
+        Examples
+        --------
+        >>> cdf = PlottingPosition.weibul([1, 2, 3])
+        >>> print(PlottingPosition.reduced_variate(cdf))
+        [-0.32663426  0.36651292  1.24589932]
+        """
+        cdf = _float_array(cdf)
+        # -log(-log(cdf)) evaluated in place on the first log.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = np.asarray(np.log(cdf))
+            np.negative(y, out=y)
+            np.log(y, out=y)
+        np.negative(y, out=y)
+        return y
+
 
 class AbstractDistribution(ABC):
     """
     AbstractDistribution.
     """
 
+    # set on each distribution class the first time its chisquare test fails, so a batch of fits warns only once.
+    _chi_warned = False
+
     def __init__(
         self,
         data: Union[list, np.ndarray] = None,
         parameters: Dict[str, float] = None,
+        dtype: type = np.float64,
     ):
         """Gumbel.
 
@@ -129,14 +361,27 @@ class AbstractDistribution(ABC):
                 location parameter
             - scale: [numeric]
                 scale parameter
+        dtype: [type], optional, default is np.float64.
+            floating point type used to store the data and to evaluate the pdf/cdf. np.float32 halves the memory
+            of the data and the bootstrap samples, the parameters are always fitted in np.float64.
         """
         if data is None and parameters is None:
             raise ValueError("Either data or parameters must be provided")
 
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("The `dtype` argument should be np.float32 or np.float64")
+        self._dtype = dtype
+
         if isinstance(data, list) or isinstance(data, np.ndarray):
-            self._data = np.array(data)
+            # store the data once as a contiguous array, so the numpy calls in the pdf/cdf/fit_model methods do not
+            # need to convert it again.
+            self._data = np.ascontiguousarray(data, dtype=dtype)
+            # number of values, used by the tests and the confidence intervals.
+            self._n = self._data.size
         elif data is None:
             self._data = data
+            self._n = None
         else:
             raise TypeError("The `data` argument should be list or numpy array")
 
@@ -144,6 +389,17 @@ class AbstractDistribution(ABC):
             self._parameters = parameters
         else:
             raise TypeError("The `parameters` argument should be dictionary")
+        # the sorted data, the plotting positions and the moments depend only on the data, they are computed on
+        # first use (an instance that is only fitted, e.g. in the bootstrap, does not need them) and then reused.
+        self._data_sorted = None
+        self._cdf_weibul = None
+        self._reduced_variate = None
+        # (mean, std) of the data, used to standardize the data in the chisquare test.
+        self._data_moments = None
+        # fitted parameters of the data, keyed by (method, obj_func, threshold).
+        self._fitted_parameters = {}
+        # theoretical quantiles at the plotting positions shared by the goodness-of-fit tests, (parameters, qth).
+        self._gof_qth = None
 
     def __str__(self) -> str:
         message = ""
@@ -183,17 +439,70 @@ class AbstractDistribution(ABC):
     @property
     def data_sorted(self) -> ndarray:
         """data_sorted."""
-        return np.sort(self.data)
+        if self._data_sorted is None and self._data is not None:
+            self._data_sorted = np.sort(self._data)
+        return self._data_sorted
+
+    @property
+    def dtype(self) -> np.dtype:
+        """floating point type of the data."""
+        return self._dtype
+
+    @property
+    def _data_float64(self) -> ndarray:
+        """data in float64, the parameters are fitted in double precision whatever the dtype of the data."""
+        return self._data.astype(np.float64, copy=False)
+
+    def _split_at_threshold(self, opt_parameters: list[float]) -> Tuple[ndarray, int]:
+        """Split the data at the threshold (the first optimized parameter).
+
+        The data is sorted once, so the split is a binary search on the sorted data, and the values below the
+        threshold are returned as a view instead of being filtered with a boolean mask at every evaluation of the
+        objective function.
+
+        Returns
+        -------
+        Tuple[np.ndarray, int]:
+            values below the threshold, number of values greater than or equal to the threshold.
+        """
+        i = np.searchsorted(self.data_sorted, opt_parameters[0], side="left")
+        return (
+            self.data_sorted[:i].astype(np.float64, copy=False),
+            self.data_sorted.size - i,
+        )
+
+    def _quantiles_at_plotting_position(self, parameters: Dict[str, float]) -> ndarray:
+        """Theoretical quantiles at the Weibul plotting positions of the data."""
+        return self.inverse_cdf(self.cdf_weibul, parameters)
+
+    def _theoretical_quantiles(self) -> ndarray:
+        """Theoretical quantiles at the Weibul plotting positions.
+
+        The quantiles are computed once for the current parameters and reused by the `ks` and `chisquare` tests.
+        """
+        key = tuple(self.parameters.items())
+        if self._gof_qth is None or self._gof_qth[0] != key:
+            self._gof_qth = (key, self._quantiles_at_plotting_position(self.parameters))
+        return self._gof_qth[1]
 
     @property
     def kstable(self) -> float:
         """KStable."""
-        return 1.22 / np.sqrt(len(self.data))
+        return 1.22 / np.sqrt(self._n)
 
     @property
     def cdf_weibul(self) -> ndarray:
         """cdf_Weibul."""
-        return PlottingPosition.weibul(self.data)
+        if self._cdf_weibul is None and self._data is not None:
+            self._cdf_weibul = PlottingPosition.weibul(self._data, dtype=self._dtype)
+        return self._cdf_weibul
+
+    @property
+    def reduced_variate(self) -> ndarray:
+        """Gumbel reduced variate -log(-log(cdf_weibul)) of the Weibul plotting positions."""
+        if self._reduced_variate is None and self._data is not None:
+            self._reduced_variate = PlottingPosition.reduced_variate(self.cdf_weibul)
+        return self._reduced_variate
 
     @staticmethod
     @abstractmethod
@@ -212,6 +521,8 @@ class AbstractDistribution(ABC):
         ylabel: str = "pdf",
         fontsize: Union[float, int] = 15,
         data: Union[List[float], np.ndarray] = None,
+        ax: Axes = None,
+        npoints: int = None,
         **kwargs,
     ) -> Union[np.ndarray, Tuple[np.ndarray, Figure, Axes]]:
         """pdf.
@@ -240,6 +551,11 @@ class AbstractDistribution(ABC):
             Default is "cdf".
         fontsize: [int]
             Default is 15.
+        ax: matplotlib.axes.Axes, optional, default is None.
+            existing axes to draw the plot on, if not given a new figure is created.
+        npoints: int, optional, default is None.
+            number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+            values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -265,8 +581,8 @@ class AbstractDistribution(ABC):
         pdf = self._pdf_eq(ts, parameters)
 
         if plot_figure:
-            qx = np.linspace(float(data_sorted[0]), 1.5 * float(data_sorted[-1]), 10000)
-            pdf_fitted = self.pdf(parameters=parameters, data=qx)
+            qx = _plot_grid(data_sorted, npoints)
+            pdf_fitted = self._pdf_eq(qx, parameters)
 
             fig, ax = Plot.pdf(
                 qx,
@@ -276,6 +592,7 @@ class AbstractDistribution(ABC):
                 xlabel=xlabel,
                 ylabel=ylabel,
                 fontsize=fontsize,
+                ax=ax,
             )
             return pdf, fig, ax
         else:
@@ -298,6 +615,8 @@ class AbstractDistribution(ABC):
         ylabel: str = "cdf",
         fontsize: int = 15,
         data: Union[List[float], np.ndarray] = None,
+        ax: Axes = None,
+        npoints: int = None,
     ) -> Union[np.ndarray, Tuple[np.ndarray, Figure, Axes]]:
         """Cumulative distribution function.
 
@@ -323,6 +642,11 @@ class AbstractDistribution(ABC):
             Default is "cdf".
         fontsize: [int]
             Default is 15.
+        ax: matplotlib.axes.Axes, optional, default is None.
+            existing axes to draw the plot on, if not given a new figure is created.
+        npoints: int, optional, default is None.
+            number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+            values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
         """
         if data is None:
             ts = self.data
@@ -338,10 +662,13 @@ class AbstractDistribution(ABC):
         cdf = self._cdf_eq(ts, parameters)
 
         if plot_figure:
-            qx = np.linspace(float(data_sorted[0]), 1.5 * float(data_sorted[-1]), 10000)
-            cdf_fitted = self.cdf(parameters=parameters, data=qx)
+            qx = _plot_grid(data_sorted, npoints)
+            cdf_fitted = self._cdf_eq(qx, parameters)
 
-            cdf_weibul = PlottingPosition.weibul(data_sorted)
+            if data is None:
+                cdf_weibul = self.cdf_weibul
+            else:
+                cdf_weibul = PlottingPosition.weibul(data_sorted)
 
             fig, ax = Plot.cdf(
                 qx,
@@ -352,6 +679,7 @@ class AbstractDistribution(ABC):
                 xlabel=xlabel,
                 ylabel=ylabel,
                 fontsize=fontsize,
+                ax=ax,
             )
 
             return cdf, fig, ax
@@ -400,12 +728,65 @@ class AbstractDistribution(ABC):
                 scale parameter of the gumbel distribution.
         """
         method = method.lower()
-        if method not in ["mle", "mm", "lmoments", "optimization"]:
+        if method not in _FIT_METHODS:
             raise ValueError(
                 f"{method} value should be 'mle', 'mm', 'lmoments' or 'optimization'"
             )
         return method
 
+    def _fit_loc_scale(
+        self,
+        estimators: Dict[str, Callable[[np.ndarray], List[float]]],
+        method: str,
+        obj_func: Callable,
+        threshold: Union[None, float, int],
+        test: bool,
+    ) -> Dict[str, float]:
+        """Shared body of `fit_model` for the two parameter (loc, scale) distributions.
+
+        Parameters
+        ----------
+        estimators: Dict[str, Callable]
+            {"mle": func, "mm": func, "lmoments": func}, each function takes the float64 data and returns [loc, scale].
+            The mle estimates are also the starting point of the "optimization" method.
+        method: str
+            validated method (the output of `AbstractDistribution.fit_model`).
+        obj_func, threshold, test:
+            see `fit_model`.
+        """
+        fit_key = (method, obj_func, threshold)
+        if fit_key not in self._fitted_parameters:
+            data = self._data_float64
+            if method == "optimization":
+                if obj_func is None or threshold is None:
+                    raise TypeError("obj_func and threshold should be numeric value")
+
+                param = estimators["mle"](data)
+                # then we use the result as starting value for your truncated fit, the objective function is
+                # evaluated up to 500 times on the contiguous float64 data, so it does not have to convert it.
+                param = so.fmin(
+                    obj_func,
+                    [threshold, param[0], param[1]],
+                    args=(data,),
+                    maxiter=500,
+                    maxfun=500,
+                )
+                # drop the threshold, [loc, scale] is a view of the result.
+                param = param[1:]
+            else:
+                param = estimators[method](data)
+
+            param = {"loc": param[0], "scale": param[1]}
+            self._fitted_parameters[fit_key] = param
+
+        param = self._fitted_parameters[fit_key].copy()
+        self.parameters = param
+
+        if test:
+            self.ks(verbose=True)
+
+        return param
+
     @abstractmethod
     def inverse_cdf(
         self,
@@ -436,12 +817,17 @@ class AbstractDistribution(ABC):
         pass
 
     @abstractmethod
-    def ks(self) -> tuple:
+    def ks(self, verbose: bool = False) -> tuple:
         """Kolmogorov-Smirnov (KS) test.
 
         The smaller the D static, the more likely that the two samples are drawn from the same distribution
         IF Pvalue < significance level ------ reject
 
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
         returns
         -------
         Dstatic: [numeric]
@@ -453,38 +839,62 @@ class AbstractDistribution(ABC):
             raise ValueError(
                 "The Value of parameters is unknown. Please use 'fit_model' to estimate the distribution parameters"
             )
-        qth = self.inverse_cdf(self.cdf_weibul, self.parameters)
+        qth = self._theoretical_quantiles()
 
-        test = ks_2samp(self.data, qth)
+        # the quantiles are evaluated at increasing probabilities, sorting them is a single pass.
+        statistic, pvalue = _ks_2samp_sorted(self.data_sorted, np.sort(qth))
 
-        print("-----KS Test--------")
-        print(f"Statistic = {test.statistic}")
-        if test.statistic < self.kstable:
-            print("Accept Hypothesis")
-        else:
-            print("reject Hypothesis")
-        print(f"P value = {test.pvalue}")
-        return test.statistic, test.pvalue
+        if verbose:
+            print("-----KS Test--------")
+            print(f"Statistic = {statistic}")
+            if statistic < self.kstable:
+                print("Accept Hypothesis")
+            else:
+                print("reject Hypothesis")
+            print(f"P value = {pvalue}")
+        return statistic, pvalue
 
     @abstractmethod
-    def chisquare(self) -> Union[tuple, None]:
-        """
-        chisquare test
+    def chisquare(self, verbose: bool = False) -> Union[tuple, None]:
+        """chisquare test
+
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
+        Returns
+        -------
+        Tuple[float, float]:
+            statistic and p-value, None if scipy rejects the samples (the sums of the standardized samples do not
+            match), a RuntimeWarning is issued for the first failure of each distribution class.
         """
         if self.parameters is None:
             raise ValueError(
                 "The Value of parameters is unknown. Please use 'fit_model' to estimate the distribution parameters"
             )
 
-        qth = self.inverse_cdf(self.cdf_weibul, self.parameters)
+        qth = self._theoretical_quantiles()
+        # standardize both samples with one allocation each, the quantiles are cached so they are not modified
+        # in place, and the mean/std of the data are computed once.
+        qth_standardized = np.subtract(qth, qth.mean())
+        np.divide(qth_standardized, qth.std(), out=qth_standardized)
+        if self._data_moments is None:
+            self._data_moments = (self.data.mean(), self.data.std())
+        data_mean, data_std = self._data_moments
+        data_standardized = np.subtract(self.data, data_mean)
+        np.divide(data_standardized, data_std, out=data_standardized)
         try:
-            test = chisquare(st.standardize(qth), st.standardize(self.data))
-            print("-----chisquare Test-----")
-            print("Statistic = " + str(test.statistic))
-            print("P value = " + str(test.pvalue))
+            test = chisquare(qth_standardized, data_standardized)
+            if verbose:
+                print("-----chisquare Test-----")
+                print("Statistic = " + str(test.statistic))
+                print("P value = " + str(test.pvalue))
             return test.statistic, test.pvalue
-        except Exception as e:
-            print(e)
+        except ValueError as e:
+            if not type(self)._chi_warned:
+                warnings.warn(f"chisquare test failed: {e}", RuntimeWarning)
+                type(self)._chi_warned = True
 
     def confidence_interval(
         self,
@@ -518,6 +928,8 @@ class AbstractDistribution(ABC):
                 Size of the second figure.
             fontsize: int, optional, default=11
                 Font size.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
 
         Returns
         -------
@@ -540,6 +952,8 @@ class AbstractDistribution(ABC):
         fontsize: int = 15,
         cdf: np.ndarray = None,
         parameters: Dict[str, Union[float, Any]] = None,
+        ax: Tuple[Axes, Axes] = None,
+        npoints: int = None,
     ) -> Tuple[List[Figure], list]:
         """Probability Plot.
 
@@ -565,6 +979,11 @@ class AbstractDistribution(ABC):
                 scale parameter of the gumbel distribution.
         cdf: [np.ndarray]
             theoretical cdf calculated using weibul or using the distribution cdf function.
+        ax: Tuple[Axes, Axes], optional, default is None.
+            existing (pdf, cdf) axes to draw the plots on, if not given a new figure is created.
+        npoints: int, optional, default is None.
+            number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+            values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -615,6 +1034,7 @@ class Gumbel(AbstractDistribution):
         self,
         data: Union[list, np.ndarray] = None,
         parameters: Dict[str, float] = None,
+        dtype: type = np.float64,
     ):
         """Gumbel.
 
@@ -629,6 +1049,9 @@ class Gumbel(AbstractDistribution):
                 location parameter of the gumbel distribution.
             - scale: [numeric]
                 scale parameter of the gumbel distribution.
+        dtype: [type], optional, default is np.float64.
+            floating point type used to store the data and to evaluate the pdf/cdf, use np.float32 to halve the
+            memory of the data and the bootstrap samples. The parameters are always fitted in np.float64.
 
         Examples
         --------
@@ -649,7 +1072,7 @@ class Gumbel(AbstractDistribution):
             >>> print(gumbel_dist) # doctest: +SKIP
             <statista.distributions.Gumbel object at 0x000001CDDEB32C00>
         """
-        super().__init__(data, parameters)
+        super().__init__(data, parameters, dtype=dtype)
         pass
 
     @staticmethod
@@ -660,9 +1083,66 @@ class Gumbel(AbstractDistribution):
         scale = parameters.get("scale")
         if scale <= 0:
             raise ValueError("Scale parameter is negative")
-        # z = (ts - loc) / scale
-        # pdf = (1.0 / scale) * (np.exp(-(z + (np.exp(-z)))))
-        pdf = gumbel_r.pdf(data, loc=loc, scale=scale)
+        # evaluate in the floating point type of the data (float32 or float64), in place on z.
+        # pdf = exp(-(z + exp(-z))) / scale
+        pdf = _standardize(data, loc, scale)
+        exp_z = np.exp(-pdf)
+        pdf += exp_z
+        np.negative(pdf, out=pdf)
+        np.exp(pdf, out=pdf)
+        pdf /= pdf.dtype.type(scale)
+        return pdf
+
+    @staticmethod
+    def pdf_broadcast(
+        data: Union[float, list, np.ndarray],
+        loc: Union[float, list, np.ndarray],
+        scale: Union[float, list, np.ndarray],
+    ) -> np.ndarray:
+        """pdf for arrays of parameters.
+
+        Evaluate the Gumbel pdf for several sets of parameters at once, the data, loc and scale are broadcast
+        against each other following the numpy broadcasting rules, e.g. a profile-likelihood sweep or the
+        parameters of bootstrap samples can be evaluated without a python loop over the parameters.
+
+        Parameters
+        ----------
+        data: [float/list/np.ndarray]
+            values to evaluate the pdf at.
+        loc: [float/list/np.ndarray]
+            location parameter(s).
+        scale: [float/list/np.ndarray]
+            scale parameter(s), all values have to be positive.
+
+        Returns
+        -------
+        np.ndarray:
+            pdf with the broadcast shape of the data, loc and scale.
+
+        Examples
+        --------
+        - Evaluate the pdf of the same data for three location parameters, the result has one row per parameter.
+
+            >>> data = np.array([1.0, 2.0, 3.0, 4.0])
+            >>> loc = np.array([[1.0], [2.0], [3.0]])
+            >>> pdf = Gumbel.pdf_broadcast(data, loc, 1.0)
+            >>> pdf.shape
+            (3, 4)
+        """
+        data = _float_array(data)
+        ftype = data.dtype.type
+        loc = np.asarray(loc, dtype=ftype)
+        scale = np.asarray(scale, dtype=ftype)
+        if np.any(scale <= 0):
+            raise ValueError("Scale parameter is negative")
+        # the first operation allocates the broadcast result, the rest is evaluated in place on it.
+        pdf = np.asarray(np.subtract(data, loc))
+        pdf /= scale
+        exp_z = np.exp(-pdf)
+        pdf += exp_z
+        np.negative(pdf, out=pdf)
+        np.exp(pdf, out=pdf)
+        pdf /= scale
         return pdf
 
     def pdf(
@@ -701,6 +1181,11 @@ class Gumbel(AbstractDistribution):
                 Default is "pdf".
             fontsize: [int]
                 Default is 15.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -794,11 +1279,50 @@ class Gumbel(AbstractDistribution):
         scale = parameters.get("scale")
         if scale <= 0:
             raise ValueError("Scale parameter is negative")
-        # z = (ts - loc) / scale
-        # cdf = np.exp(-np.exp(-z))
-        cdf = gumbel_r.cdf(data, loc=loc, scale=scale)
+        # evaluate in the floating point type of the data (float32 or float64), in place on z.
+        # cdf = exp(-exp(-z))
+        cdf = _standardize(data, loc, scale)
+        np.negative(cdf, out=cdf)
+        np.exp(cdf, out=cdf)
+        np.negative(cdf, out=cdf)
+        np.exp(cdf, out=cdf)
         return cdf
 
+    @staticmethod
+    def _sf_eq(
+        data: Union[list, np.ndarray], parameters: Dict[str, Union[float, Any]]
+    ) -> np.ndarray:
+        """survival function 1 - cdf = -expm1(-exp(-z)), accurate in the upper tail where the cdf rounds to 1."""
+        loc = parameters.get("loc")
+        scale = parameters.get("scale")
+        if scale <= 0:
+            raise ValueError("Scale parameter is negative")
+        sf = _standardize(data, loc, scale)
+        np.negative(sf, out=sf)
+        np.exp(sf, out=sf)
+        np.negative(sf, out=sf)
+        np.expm1(sf, out=sf)
+        np.negative(sf, out=sf)
+        return sf
+
+    @staticmethod
+    def _pdf_cdf_eq(
+        data: Union[list, np.ndarray], parameters: Dict[str, Union[float, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """pdf and cdf evaluated together, the pdf is exp(-z) * cdf / scale so both share z and exp(-z)."""
+        loc = parameters.get("loc")
+        scale = parameters.get("scale")
+        if scale <= 0:
+            raise ValueError("Scale parameter is negative")
+        exp_z = _standardize(data, loc, scale)
+        np.negative(exp_z, out=exp_z)
+        np.exp(exp_z, out=exp_z)
+        cdf = np.exp(-exp_z)
+        pdf = exp_z
+        pdf *= cdf
+        pdf /= pdf.dtype.type(scale)
+        return pdf, cdf
+
     def cdf(
         self,
         plot_figure: bool = False,
@@ -835,6 +1359,11 @@ class Gumbel(AbstractDistribution):
                 Default is "cdf".
             fontsize: [int]
                 Default is 15.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -899,9 +1428,10 @@ class Gumbel(AbstractDistribution):
         if parameters is None:
             parameters = self.parameters
 
-        cdf: np.ndarray = self.cdf(parameters, data=ts)
-
-        rp = 1 / (1 - cdf)
+        # rp = 1 / (1 - cdf), from the survival function to keep the precision of the large return periods.
+        rp = self._sf_eq(ts, parameters)
+        with np.errstate(divide="ignore"):
+            np.reciprocal(rp, out=rp)
 
         return rp
 
@@ -927,32 +1457,104 @@ class Gumbel(AbstractDistribution):
         data: list
             data
         """
+        data = np.asarray(data, dtype=np.float64)
+        non_truncated_data = data[data < opt_parameters[0]]
+        return Gumbel._truncated_nll(
+            opt_parameters, non_truncated_data, data.size - non_truncated_data.size
+        )
+
+    @staticmethod
+    def _truncated_nll(
+        opt_parameters: list[float], non_truncated_data: np.ndarray, nx2: int
+    ) -> float:
+        """negative log-likelihood of `truncated_distribution` for data already split at the threshold.
+
+        Parameters
+        ----------
+        opt_parameters: list
+            [threshold, loc, scale]
+        non_truncated_data: np.ndarray
+            values below the threshold.
+        nx2: int
+            number of values greater than or equal to the threshold.
+        """
         threshold = opt_parameters[0]
         loc = opt_parameters[1]
         scale = opt_parameters[2]
+        if scale <= 0:
+            return np.inf
 
-        non_truncated_data = data[data < threshold]
-        nx2 = len(data[data >= threshold])
-        # pdf with a scaled pdf
-        # L1 is pdf based
-        parameters = {"loc": loc, "scale": scale}
-        pdf = Gumbel._pdf_eq(non_truncated_data, parameters)
+        # L1 is pdf based, -log(pdf) = log(scale) + z + exp(-z)
+        z = (non_truncated_data - loc) / scale
+        l1 = non_truncated_data.size * np.log(scale) + z.sum() + np.exp(-z).sum()
         #  the CDF at the threshold is used because the data is assumed to be truncated, meaning that observations below
         #  this threshold are not included in the dataset. When dealing with truncated data, it's essential to adjust
         #  the likelihood calculation to account for the fact that only values above the threshold are observed. The
         #  CDF at the threshold effectively normalizes the distribution, ensuring that the probabilities sum to 1 over
         #  the range of the observed data.
-        cdf_at_threshold = 1 - Gumbel._cdf_eq(threshold, parameters)
-        # calculates the negative log-likelihood of a Gumbel distribution
-        # Adjust the likelihood for the truncation
-        # likelihood = pdf / (1 - adjusted_cdf)
-
-        l1 = (-np.log((pdf / scale))).sum()
-        # L2 is cdf based
-        l2 = (-np.log(cdf_at_threshold)) * nx2
-        # print x1, nx2, L1, L2
+        # L2 is cdf based, 1 - F(threshold) = 1 - exp(-exp(-z_threshold))
+        z_threshold = (threshold - loc) / scale
+        l2 = -np.log(-np.expm1(-np.exp(-z_threshold))) * nx2
         return l1 + l2
 
+    @staticmethod
+    def _truncated_nll_grad(
+        opt_parameters: list[float], non_truncated_data: np.ndarray, nx2: int
+    ) -> Tuple[float, np.ndarray]:
+        """negative log-likelihood of `truncated_distribution` and its gradient with respect to [threshold, loc, scale].
+
+        The data is split at the threshold, so the gradient is the derivative of the likelihood for the current split
+        (the likelihood jumps when the threshold crosses a value of the data).
+        """
+        threshold = opt_parameters[0]
+        loc = opt_parameters[1]
+        scale = opt_parameters[2]
+        if scale <= 0:
+            return np.inf, np.zeros(3)
+
+        n = non_truncated_data.size
+        z = (non_truncated_data - loc) / scale
+        exp_z = np.exp(-z)
+        sum_z = z.sum()
+        sum_exp_z = exp_z.sum()
+        l1 = n * np.log(scale) + sum_z + sum_exp_z
+
+        z_threshold = (threshold - loc) / scale
+        with np.errstate(over="ignore", invalid="ignore"):
+            u = np.exp(-z_threshold)
+            l2 = -np.log(-np.expm1(-u)) * nx2
+            # d(l2)/d(z_threshold) = nx2 * u / (exp(u) - 1)
+            dl2 = nx2 * u / np.expm1(u) if u > 0 else float(nx2)
+        if not np.isfinite(dl2):
+            dl2 = 0.0
+
+        grad = np.array(
+            [
+                dl2 / scale,
+                (sum_exp_z - n - dl2) / scale,
+                (n - sum_z + np.dot(exp_z, z) - dl2 * z_threshold) / scale,
+            ]
+        )
+        return l1 + l2, grad
+
+    def _fit_mle(self) -> List[float]:
+        """maximum likelihood estimates [loc, scale] starting from the L-moments estimates."""
+        data = self._data_float64
+        # the likelihood equations are solved with a root finder, the L-moments scale is used as the initial
+        # guess to bracket the root instead of expanding the bracket from a scale of 1.
+        try:
+            loc, scale = Lmoments.gumbel(Lmoments(data).Lmom(2))
+        except ValueError:
+            # too few values or constant data, scipy's own starting values are used.
+            return [float(i) for i in gumbel_r.fit(data)]
+        try:
+            param = _gumbel_mle(data, scale)
+        except (ValueError, RuntimeError):
+            param = [np.nan, np.nan]
+        if not np.all(np.isfinite(param)):
+            param = list(gumbel_r.fit(data, loc=loc, scale=scale))
+        return [float(i) for i in param]
+
     def fit_model(
         self,
         method: str = "mle",
@@ -1047,34 +1649,65 @@ class Gumbel(AbstractDistribution):
         # Par1 = so.fmin(obj_func, [0.5,0.5], args=(np.array(data),))
         method = super().fit_model(method=method)
 
-        if method == "mle" or method == "mm":
-            param = list(gumbel_r.fit(self.data, method=method))
-        elif method == "lmoments":
-            lm = Lmoments(self.data)
-            lmu = lm.Lmom()
-            param = Lmoments.gumbel(lmu)
-        elif method == "optimization":
-            if obj_func is None or threshold is None:
-                raise TypeError("threshold should be numeric value")
-
-            param = gumbel_r.fit(self.data, method="mle")
-            # then we use the result as starting value for your truncated Gumbel fit
-            param = so.fmin(
-                obj_func,
-                [threshold, param[0], param[1]],
-                args=(self.data,),
-                maxiter=500,
-                maxfun=500,
-            )
-            param = [param[1], param[2]]
-        else:
-            raise ValueError(f"The given: {method} does not exist")
-
-        param = {"loc": param[0], "scale": param[1]}
+        fit_key = (method, obj_func, threshold)
+        if fit_key not in self._fitted_parameters:
+            if method == "mle":
+                param = self._fit_mle()
+            elif method == "mm":
+                param = gumbel_r.fit(self._data_float64, method=method)
+            elif method == "lmoments":
+                lm = Lmoments(self._data_float64)
+                lmu = lm.Lmom()
+                param = Lmoments.gumbel(lmu)
+            elif method == "optimization":
+                if obj_func is None or threshold is None:
+                    raise TypeError("threshold should be numeric value")
+
+                param = self._fit_mle()
+                # then we use the result as starting value for your truncated Gumbel fit
+                if obj_func is Gumbel.truncated_distribution:
+                    # the threshold is kept at the given value, left free the likelihood is maximized by moving it
+                    # below all the values (the likelihood is then 1 whatever loc and scale are). The data is split
+                    # at the threshold once, and the analytic gradient of the likelihood is used.
+                    split = self._split_at_threshold([threshold])
+
+                    def objective(p):
+                        nll, grad = Gumbel._truncated_nll_grad(
+                            [threshold, p[0], p[1]], *split
+                        )
+                        return nll, grad[1:]
+
+                    res = so.minimize(
+                        objective,
+                        param,
+                        jac=True,
+                        method="L-BFGS-B",
+                        bounds=[(None, None), (ninf, None)],
+                        options={"ftol": 1e-12, "gtol": 1e-9},
+                    )
+                    param = res.x
+                else:
+                    # no gradient for a user defined objective function.
+                    param = so.fmin(
+                        obj_func,
+                        [threshold, param[0], param[1]],
+                        args=(self._data_float64,),
+                        maxiter=500,
+                        maxfun=500,
+                    )
+                    # drop the threshold, [loc, scale] is a view of the result.
+                    param = param[1:]
+            else:
+                raise ValueError(f"The given: {method} does not exist")
+
+            param = {"loc": param[0], "scale": param[1]}
+            self._fitted_parameters[fit_key] = param
+
+        param = self._fitted_parameters[fit_key].copy()
         self.parameters = param
 
         if test:
-            self.ks()
+            self.ks(verbose=True)
             # self.chisquare()
 
         return param
@@ -1083,6 +1716,7 @@ class Gumbel(AbstractDistribution):
         self,
         cdf: Union[np.ndarray, List[float]] = None,
         parameters: Dict[str, float] = None,
+        reduced_variate: np.ndarray = None,
     ) -> np.ndarray:
         """inverse CDF.
 
@@ -1099,6 +1733,9 @@ class Gumbel(AbstractDistribution):
                 scale parameter of the gumbel distribution.
         cdf: [list]
             cumulative distribution function/ Non Exceedance probability.
+        reduced_variate: [np.ndarray], optional, default is None.
+            precomputed reduced variate -log(-log(cdf)) (see `PlottingPosition.reduced_variate`), used instead of the
+            cdf to avoid evaluating the logarithms again for the same cdf.
 
         Returns
         -------
@@ -1124,33 +1761,50 @@ class Gumbel(AbstractDistribution):
         if parameters is None:
             parameters = self.parameters
 
-        if any(cdf) <= 0 or any(cdf) > 1:
+        if reduced_variate is not None:
+            return self._inv_cdf_reduced(reduced_variate, parameters)
+
+        cdf = np.asarray(cdf, dtype=np.float64)
+        if cdf.size and (cdf.min() <= 0 or cdf.max() > 1):
             raise ValueError("cdf Value Invalid")
 
-        cdf = np.array(cdf)
         qth = self._inv_cdf(cdf, parameters)
 
         return qth
 
     @staticmethod
     def _inv_cdf(cdf: Union[np.ndarray, List[float]], parameters: Dict[str, float]):
-        # the main equation from scipy
+        return Gumbel._inv_cdf_reduced(
+            PlottingPosition.reduced_variate(cdf), parameters
+        )
+
+    @staticmethod
+    def _inv_cdf_reduced(reduced_variate: np.ndarray, parameters: Dict[str, float]):
+        """inverse cdf as a function of the reduced variate y = -log(-log(cdf))."""
         loc = parameters.get("loc")
         scale = parameters.get("scale")
         if scale <= 0:
             raise ValueError("Scale parameter is negative")
         # the main equation from scipy
         # Qth = loc - scale * (np.log(-np.log(cdf)))
-        qth = gumbel_r.ppf(cdf, loc=loc, scale=scale)
+        qth = loc + scale * reduced_variate
 
         return qth
 
-    def ks(self) -> tuple:
+    def _quantiles_at_plotting_position(self, parameters: Dict[str, float]) -> ndarray:
+        return self._inv_cdf_reduced(self.reduced_variate, parameters)
+
+    def ks(self, verbose: bool = False) -> tuple:
         """Kolmogorov-Smirnov (KS) test.
 
         The smaller the D static, the more likely that the two samples are drawn from the same distribution
         IF P value < significance level ------ reject
 
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
         Returns
         -------
         Dstatic: [numeric]
@@ -1164,11 +1818,17 @@ class Gumbel(AbstractDistribution):
             A high p-value (close to 1) suggests that there is a high probability that the sample comes from the
             specified distribution. IF P value < significance level ------ reject the null hypothesis
         """
-        return super().ks()
+        return super().ks(verbose=verbose)
 
-    def chisquare(self) -> tuple:
-        """chisquare test"""
-        return super().chisquare()
+    def chisquare(self, verbose: bool = False) -> tuple:
+        """chisquare test
+
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+        """
+        return super().chisquare(verbose=verbose)
 
     def confidence_interval(
         self,
@@ -1198,11 +1858,15 @@ class Gumbel(AbstractDistribution):
                 scale parameter of the gumbel distribution.
         prob_non_exceed: list, default is None.
             Non-Exceedance probability, if not given, the plotting position will be calculated using the weibul method.
+            Any number of probabilities can be given, except with `plot_figure=True` where the bounds are plotted
+            against the data, and the length has to be the same as the data.
         kwargs:
             fig_size: Tuple[float, float], optional, default=(6, 6)
                 Size of the second figure.
             fontsize: int, optional, default=11
                 Font size.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
 
         Returns
         -------
@@ -1244,25 +1908,28 @@ class Gumbel(AbstractDistribution):
             raise ValueError("Scale parameter is negative")
 
         if prob_non_exceed is None:
-            prob_non_exceed = PlottingPosition.weibul(self.data)
+            prob_non_exceed = self.cdf_weibul
+            y = self.reduced_variate
         else:
-            # if the prob_non_exceed is given, check if the length is the same as the data
-            if len(prob_non_exceed) != len(self.data):
+            # the bounds can be evaluated at any number of probabilities, but the plot draws them against the data.
+            if plot_figure and len(prob_non_exceed) != self._n:
                 raise ValueError(
                     "Length of prob_non_exceed does not match the length of data, use the `PlottingPosition.weibul(data)` "
                     "to the get the non-exceedance probability"
                 )
-
-        qth = self._inv_cdf(prob_non_exceed, parameters)
-        y = [-np.log(-np.log(j)) for j in prob_non_exceed]
-        std_error = [
-            (scale / np.sqrt(len(self.data)))
-            * np.sqrt(1.1087 + 0.5140 * j + 0.6079 * j**2)
-            for j in y
-        ]
-        v = norm.ppf(1 - alpha / 2)
-        q_upper = np.array([qth[j] + v * std_error[j] for j in range(len(self.data))])
-        q_lower = np.array([qth[j] - v * std_error[j] for j in range(len(self.data))])
+            y = PlottingPosition.reduced_variate(prob_non_exceed)
+
+        qth = self._inv_cdf_reduced(y, parameters)
+        # the standard error of the quantile is a quadratic in the reduced variate, evaluated for all the
+        # probabilities at once in one buffer (Horner form), which then holds the half width of the interval.
+        half_width = np.multiply(y, 0.6079)
+        half_width += 0.5140
+        half_width *= y
+        half_width += 1.1087
+        np.sqrt(half_width, out=half_width)
+        half_width *= _norm_ppf_half(alpha) * scale / np.sqrt(self._n)
+        q_upper = qth + half_width
+        q_lower = np.subtract(qth, half_width, out=half_width)
 
         if plot_figure:
             fig, ax = Plot.confidence_level(
@@ -1280,6 +1947,8 @@ class Gumbel(AbstractDistribution):
         fontsize: int = 15,
         cdf: Union[np.ndarray, list] = None,
         parameters: Dict[str, Union[float, Any]] = None,
+        ax: Tuple[Axes, Axes] = None,
+        npoints: int = None,
     ) -> Tuple[Figure, Tuple[Axes, Axes]]:  # pylint: disable=arguments-differ
         """Probability plot.
 
@@ -1307,6 +1976,11 @@ class Gumbel(AbstractDistribution):
                 location parameter of the gumbel distribution.
             - scale: [numeric]
                 scale parameter of the gumbel distribution.
+        ax: Tuple[Axes, Axes], optional, default is None.
+            existing (pdf, cdf) axes to draw the plots on, if not given a new figure is created.
+        npoints: int, optional, default is None.
+            number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+            values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -1345,20 +2019,17 @@ class Gumbel(AbstractDistribution):
             raise ValueError("Scale parameter is negative")
 
         if cdf is None:
-            cdf = PlottingPosition.weibul(self.data)
+            cdf = self.cdf_weibul
         else:
             # if the cdf is given, check if the length is the same as the data
-            if len(cdf) != len(self.data):
+            if len(cdf) != self._n:
                 raise ValueError(
                     "Length of cdf does not match the length of data, use the `PlottingPosition.weibul(data)` "
                     "to the get the non-exceedance probability"
                 )
 
-        q_x = np.linspace(
-            float(self.data_sorted[0]), 1.5 * float(self.data_sorted[-1]), 10000
-        )
-        pdf_fitted: np.ndarray = self.pdf(parameters=parameters, data=q_x)
-        cdf_fitted: np.ndarray = self.cdf(parameters=parameters, data=q_x)
+        q_x = _plot_grid(self.data, npoints)
+        pdf_fitted, cdf_fitted = self._pdf_cdf_eq(q_x, parameters)
 
         fig, ax = Plot.details(
             q_x,
@@ -1370,6 +2041,7 @@ class Gumbel(AbstractDistribution):
             xlabel=xlabel,
             ylabel=ylabel,
             fontsize=fontsize,
+            ax=ax,
         )
 
         return fig, ax
@@ -1432,6 +2104,7 @@ class GEV(AbstractDistribution):
         self,
         data: Union[list, np.ndarray] = None,
         parameters: Dict[str, float] = None,
+        dtype: type = np.float64,
     ):
         """GEV.
 
@@ -1448,6 +2121,9 @@ class GEV(AbstractDistribution):
                 scale parameter of the GEV distribution.
             - shape: [numeric]
                 shape parameter of the GEV distribution.
+        dtype: [type], optional, default is np.float64.
+            floating point type used to store the data and to evaluate the pdf/cdf, use np.float32 to halve the
+            memory of the data and the bootstrap samples. The parameters are always fitted in np.float64.
 
         Examples
         --------
@@ -1468,7 +2144,7 @@ class GEV(AbstractDistribution):
             >>> print(gev_dist) # doctest: +SKIP
             <statista.distributions.Gumbel object at 0x000001CDDEB32C00>
         """
-        super().__init__(data, parameters)
+        super().__init__(data, parameters, dtype=dtype)
         pass
 
     @staticmethod
@@ -1478,36 +2154,29 @@ class GEV(AbstractDistribution):
         loc = parameters.get("loc")
         scale = parameters.get("scale")
         shape = parameters.get("shape")
-        # pdf = []
-        # for ts_i in ts:
-        #     z = (ts_i - loc) / scale
-        #
-        #     # Gumbel
-        #     if shape == 0:
-        #         val = np.exp(-(z + np.exp(-z)))
-        #         pdf.append((1 / scale) * val)
-        #         continue
-        #
-        #     # GEV
-        #     y = 1 - shape * z
-        #     if y > ninf:
-        #         # np.log(y) = ln(y)
-        #         # ln is the inverse of e
-        #         lnY = (-1 / shape) * np.log(y)
-        #         val = np.exp(-(1 - shape) * lnY - np.exp(-lnY))
-        #         pdf.append((1 / scale) * val)
-        #         continue
-        #
-        #     if shape < 0:
-        #         pdf.append(0)
-        #         continue
-        #     pdf.append(0)
-        #
-        # if len(pdf) == 1:
-        #     pdf = pdf[0]
-
-        # pdf = np.array(pdf)
-        pdf = genextreme.pdf(data, loc=loc, scale=scale, c=shape)
+        if abs(shape) < _GUMBEL_SHAPE_TOL:
+            # GEV is Gumbel distribution
+            return Gumbel._pdf_eq(data, parameters)
+        # equation https://www.rdocumentation.org/packages/evd/versions/2.3-6/topics/fextreme
+        # (scipy sign convention of the shape parameter)
+        # pdf = exp((1 - shape) * log(t) - t) / scale, log(t) = log(1 - shape * z) / shape
+        # evaluate in the floating point type of the data (float32 or float64), in place on z.
+        pdf = _standardize(data, loc, scale)
+        ftype = pdf.dtype.type
+        shape = ftype(shape)
+        pdf *= -shape
+        # the support of the distribution is 1 - shape * z > 0
+        outside = pdf <= -1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            np.log1p(pdf, out=pdf)
+            pdf /= shape
+            t = np.exp(pdf)
+            pdf *= 1 - shape
+            pdf -= t
+            np.exp(pdf, out=pdf)
+        pdf /= ftype(scale)
+        # zero density outside the support of the distribution
+        pdf[outside] = 0.0
         return pdf
 
     def pdf(
@@ -1548,6 +2217,11 @@ class GEV(AbstractDistribution):
                 Default is "pdf".
             fontsize: [int]
                 Default is 15
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -1643,27 +2317,87 @@ class GEV(AbstractDistribution):
         loc = parameters.get("loc")
         scale = parameters.get("scale")
         shape = parameters.get("shape")
+        if abs(shape) < _GUMBEL_SHAPE_TOL:
+            # GEV is Gumbel distribution
+            return Gumbel._cdf_eq(data, parameters)
         # equation https://www.rdocumentation.org/packages/evd/versions/2.3-6/topics/fextreme
-        # z = (ts - loc) / scale
-        # if shape == 0:
-        #     # GEV is Gumbel distribution
-        #     cdf = np.exp(-np.exp(-z))
-        # else:
-        #     y = 1 - shape * z
-        #     cdf = list()
-        #     for y_i in y:
-        #         if y_i > ninf:
-        #             logY = -np.log(y_i) / shape
-        #             cdf.append(np.exp(-np.exp(-logY)))
-        #         elif shape < 0:
-        #             cdf.append(0)
-        #         else:
-        #             cdf.append(1)
-        #
-        # cdf = np.array(cdf)
-        cdf = genextreme.cdf(data, c=shape, loc=loc, scale=scale)
+        # cdf = exp(-t), t = exp(log(1 - shape * z) / shape)
+        # evaluate in the floating point type of the data (float32 or float64), in place on z.
+        cdf = _standardize(data, loc, scale)
+        shape = cdf.dtype.type(shape)
+        cdf *= -shape
+        # the support of the distribution is 1 - shape * z > 0
+        outside = cdf <= -1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            np.log1p(cdf, out=cdf)
+            cdf /= shape
+            np.exp(cdf, out=cdf)
+            np.negative(cdf, out=cdf)
+            np.exp(cdf, out=cdf)
+        # outside the support the cdf is 0 below the lower bound (shape < 0) and 1 above the upper
+        # bound (shape > 0)
+        cdf[outside] = 0.0 if shape < 0 else 1.0
         return cdf
 
+    @staticmethod
+    def _sf_eq(
+        data: Union[list, np.ndarray], parameters: Dict[str, Union[float, Any]]
+    ) -> np.ndarray:
+        """survival function 1 - cdf = -expm1(-t), accurate in the upper tail where the cdf rounds to 1."""
+        loc = parameters.get("loc")
+        scale = parameters.get("scale")
+        shape = parameters.get("shape")
+        if abs(shape) < _GUMBEL_SHAPE_TOL:
+            # GEV is Gumbel distribution
+            return Gumbel._sf_eq(data, parameters)
+        sf = _standardize(data, loc, scale)
+        shape = sf.dtype.type(shape)
+        sf *= -shape
+        # the support of the distribution is 1 - shape * z > 0
+        outside = sf <= -1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            np.log1p(sf, out=sf)
+            sf /= shape
+            np.exp(sf, out=sf)
+            np.negative(sf, out=sf)
+            np.expm1(sf, out=sf)
+            np.negative(sf, out=sf)
+        # outside the support the sf is 1 below the lower bound (shape < 0) and 0 above the upper bound (shape > 0)
+        sf[outside] = 1.0 if shape < 0 else 0.0
+        return sf
+
+    @staticmethod
+    def _pdf_cdf_eq(
+        data: Union[list, np.ndarray], parameters: Dict[str, Union[float, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """pdf and cdf evaluated together, the pdf is t**(1 - shape) * cdf / scale so both share t."""
+        loc = parameters.get("loc")
+        scale = parameters.get("scale")
+        shape = parameters.get("shape")
+        if abs(shape) < _GUMBEL_SHAPE_TOL:
+            # GEV is Gumbel distribution
+            return Gumbel._pdf_cdf_eq(data, parameters)
+        log_t = _standardize(data, loc, scale)
+        ftype = log_t.dtype.type
+        shape = ftype(shape)
+        log_t *= -shape
+        # the support of the distribution is 1 - shape * z > 0
+        outside = log_t <= -1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            np.log1p(log_t, out=log_t)
+            log_t /= shape
+            cdf = np.exp(log_t)
+            np.negative(cdf, out=cdf)
+            np.exp(cdf, out=cdf)
+            pdf = log_t
+            pdf *= 1 - shape
+            np.exp(pdf, out=pdf)
+            pdf *= cdf
+        pdf /= ftype(scale)
+        pdf[outside] = 0.0
+        cdf[outside] = 0.0 if shape < 0 else 1.0
+        return pdf, cdf
+
     def cdf(
         self,
         plot_figure: bool = False,
@@ -1702,6 +2436,11 @@ class GEV(AbstractDistribution):
                 Default is "cdf".
             fontsize: [int]
                 Default is 15.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -1755,12 +2494,244 @@ class GEV(AbstractDistribution):
         float:
             return period
         """
-        cdf = self.cdf(parameters, data=data)
-
-        rp = 1 / (1 - cdf)
+        # rp = 1 / (1 - cdf), from the survival function to keep the precision of the large return periods.
+        rp = self._sf_eq(data, parameters)
+        with np.errstate(divide="ignore"):
+            np.reciprocal(rp, out=rp)
 
         return rp
 
+    @staticmethod
+    def _negative_log_likelihood(
+        parameters: np.ndarray, data: np.ndarray
+    ) -> Tuple[float, np.ndarray]:
+        """negative log-likelihood of the GEV distribution and its gradient.
+
+        Parameters
+        ----------
+        parameters: np.ndarray
+            [shape, loc, scale]
+        data: np.ndarray
+            data
+
+        Returns
+        -------
+        Tuple[float, np.ndarray]:
+            the negative log-likelihood, and its gradient with respect to [shape, loc, scale].
+        """
+        shape, loc, scale = parameters
+        if scale <= 0:
+            return np.inf, np.zeros(3)
+        z = (data - loc) / scale
+
+        if shape == 0:
+            # Gumbel
+            n = z.size
+            exp_z = np.exp(-z)
+            nll = n * np.log(scale) + z.sum() + exp_z.sum()
+            grad = np.array(
+                [
+                    # limit of the shape derivative for shape -> 0
+                    (z * (0.5 * z * (1 - exp_z) - 1)).sum(),
+                    (exp_z.sum() - n) / scale,
+                    (n - z.sum() + (z * exp_z).sum()) / scale,
+                ]
+            )
+            return nll, grad
+
+        y = 1 - shape * z
+        # values outside the support of the distribution are penalized the same way scipy penalizes them in the
+        # `nnlf`, the penalty is finite so that the line search of the optimizer can step back into the support.
+        in_support = y > 0
+        n_out = z.size - np.count_nonzero(in_support)
+        z = z[in_support]
+        y = y[in_support]
+        n = z.size
+
+        log_y = np.log1p(-shape * z)
+        t = np.exp(log_y / shape)
+        nll = (
+            n * np.log(scale)
+            - (1 / shape - 1) * log_y.sum()
+            + t.sum()
+            + n_out * _OUT_OF_SUPPORT_PENALTY
+        )
+        # derivative of the nll with respect to y (multiplied by shape), y depends on the three parameters.
+        w = (t - 1 + shape) / y
+        wz = (w * z).sum()
+        grad = np.array(
+            [
+                ((1 - t) * log_y).sum() / shape**2 - wz / shape,
+                w.sum() / scale,
+                n / scale + wz / scale,
+            ]
+        )
+        return nll, grad
+
+    @staticmethod
+    def truncated_distribution(opt_parameters: list[float], data: list[float]):
+        """function to estimate the parameters of a truncated GEV distribution.
+
+        The GEV counterpart of `Gumbel.truncated_distribution`, the function calculates the negative log-likelihood
+        of a GEV distribution where the values below the threshold contribute through the pdf, and the values
+        above the threshold contribute through the probability of exceeding the threshold (1-F(threshold)).
+
+        Parameters
+        ----------
+        opt_parameters: list
+            [threshold, shape, loc, scale]
+        data: list
+            data
+        """
+        data = np.asarray(data, dtype=np.float64)
+        non_truncated_data = data[data < opt_parameters[0]]
+        return GEV._truncated_nll(
+            opt_parameters, non_truncated_data, data.size - non_truncated_data.size
+        )
+
+    @staticmethod
+    def _truncated_nll(
+        opt_parameters: list[float], non_truncated_data: np.ndarray, nx2: int
+    ) -> float:
+        """negative log-likelihood of `truncated_distribution` for data already split at the threshold.
+
+        Parameters
+        ----------
+        opt_parameters: list
+            [threshold, shape, loc, scale]
+        non_truncated_data: np.ndarray
+            values below the threshold.
+        nx2: int
+            number of values greater than or equal to the threshold.
+        """
+        threshold = opt_parameters[0]
+        shape = opt_parameters[1]
+        loc = opt_parameters[2]
+        scale = opt_parameters[3]
+        if scale <= 0:
+            return np.inf
+
+        z = (non_truncated_data - loc) / scale
+        z_threshold = (threshold - loc) / scale
+
+        if shape == 0:
+            l1 = non_truncated_data.size * np.log(scale) + z.sum() + np.exp(-z).sum()
+            t_threshold = np.exp(-z_threshold)
+        else:
+            y = 1 - shape * z
+            # the data has to be within the support of the distribution
+            if np.any(y <= 0):
+                return np.inf
+            # L1 is pdf based, -log(pdf) = log(scale) - (1/shape - 1) * log(y) + y^(1/shape)
+            log_y = np.log(y)
+            l1 = (
+                non_truncated_data.size * np.log(scale)
+                - (1 / shape - 1) * log_y.sum()
+                + np.exp(log_y / shape).sum()
+            )
+            y_threshold = 1 - shape * z_threshold
+            if y_threshold <= 0:
+                # the threshold is below the lower bound (F=0) or above the upper bound (F=1) of the distribution.
+                if shape > 0 and nx2 > 0:
+                    return np.inf
+                return l1
+            t_threshold = y_threshold ** (1 / shape)
+
+        # L2 is cdf based, 1 - F(threshold) = 1 - exp(-t)
+        l2 = -np.log(-np.expm1(-t_threshold)) * nx2
+        return l1 + l2
+
+    @staticmethod
+    def _truncated_nll_grad(
+        opt_parameters: list[float], non_truncated_data: np.ndarray, nx2: int
+    ) -> Tuple[float, np.ndarray]:
+        """negative log-likelihood of `truncated_distribution` and its gradient with respect to [threshold, shape,
+        loc, scale].
+
+        The pdf part is `_negative_log_likelihood` of the values below the threshold (values outside the support
+        get the same finite penalty), the gradient is the derivative of the likelihood for the current split of the
+        data (the likelihood jumps when the threshold crosses a value of the data).
+        """
+        threshold, shape, loc, scale = opt_parameters
+        if scale <= 0:
+            return np.inf, np.zeros(4)
+
+        l1, grad1 = GEV._negative_log_likelihood(
+            np.array([shape, loc, scale]), non_truncated_data
+        )
+        if nx2 == 0:
+            return l1, np.concatenate([[0.0], grad1])
+
+        z_threshold = (threshold - loc) / scale
+        if shape == 0:
+            t_threshold = np.exp(-z_threshold)
+            # derivatives of t with respect to z and shape (limit for shape -> 0)
+            dt_dz = -t_threshold
+            dt_dshape = -0.5 * t_threshold * z_threshold**2
+        else:
+            y_threshold = 1 - shape * z_threshold
+            if y_threshold <= 0:
+                # the threshold is above the upper bound (F=1, shape > 0), or below the lower bound (F=0, shape < 0)
+                # of the distribution.
+                l2 = nx2 * _OUT_OF_SUPPORT_PENALTY if shape > 0 else 0.0
+                return l1 + l2, np.concatenate([[0.0], grad1])
+            log_y = np.log(y_threshold)
+            t_threshold = np.exp(log_y / shape)
+            dt_dz = -t_threshold / y_threshold
+            dt_dshape = t_threshold * (
+                -log_y / shape**2 - z_threshold / (shape * y_threshold)
+            )
+
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            # L2 = -nx2 * log(1 - exp(-t)), d(L2)/dt = -nx2 / (exp(t) - 1)
+            l2 = -np.log(-np.expm1(-t_threshold)) * nx2
+            dl2_dt = -nx2 / np.expm1(t_threshold)
+        if not np.isfinite(dl2_dt):
+            dl2_dt = 0.0
+        dl2_dz = dl2_dt * dt_dz
+
+        grad = np.array(
+            [
+                dl2_dz / scale,
+                grad1[0] + dl2_dt * dt_dshape,
+                grad1[1] - dl2_dz / scale,
+                grad1[2] - dl2_dz * z_threshold / scale,
+            ]
+        )
+        return l1 + l2, grad
+
+    def _fit_mle(self) -> List[float]:
+        """maximum likelihood estimates [shape, loc, scale].
+
+        L-BFGS-B with the closed form gradient of the likelihood, starting from the L-moments estimates. When the
+        L-moments cannot be computed (constant data), the optimization fails, or the result leaves a value of the
+        data outside the support of the distribution, `genextreme.fit` is used.
+        """
+        data = self._data_float64
+        x0 = _gev_lmoments_start(data)
+        if x0 is None:
+            return list(genextreme.fit(data))
+
+        # the penalty of the values outside the support is flat, the optimizer can not bring them back in, so the
+        # shape is shrunk toward 0 (Gumbel, unbounded support) until all the values are inside the support.
+        shape, loc, scale = x0
+        max_shape_z = np.max(shape * (data - loc) / scale)
+        if max_shape_z >= 1:
+            shape *= 0.9 / max_shape_z
+
+        res = so.minimize(
+            GEV._negative_log_likelihood,
+            [shape, loc, scale],
+            args=(data,),
+            jac=True,
+            method="L-BFGS-B",
+            bounds=[(None, None), (None, None), (ninf, None)],
+            options={"ftol": 1e-12, "gtol": 1e-9},
+        )
+        if not res.success or not np.isfinite(genextreme.nnlf(res.x, data)):
+            return list(genextreme.fit(data))
+        return list(res.x)
+
     def fit_model(
         self,
         method: str = "mle",
@@ -1821,7 +2792,7 @@ class GEV(AbstractDistribution):
             Accept Hypothesis
             P value = 0.9942356257694902
             >>> print(parameters)
-            {'loc': -0.05962776672431072, 'scale': 0.9114319092295455, 'shape': 0.03492066094614391}
+            {'loc': -0.059599329617835865, 'scale': 0.9114537577903057, 'shape': 0.034926933712064324}
 
         - You can also use the `lmoments` method to estimate the distribution parameters.
 
@@ -1845,34 +2816,70 @@ class GEV(AbstractDistribution):
         # Par1 = so.fmin(obj_func, [0.5,0.5], args=(np.array(data),))
 
         method = super().fit_model(method=method)
-        if method == "mle" or method == "mm":
-            param = list(genextreme.fit(self.data, method=method))
-        elif method == "lmoments":
-            lm = Lmoments(self.data)
-            lmu = lm.Lmom()
-            param = Lmoments.gev(lmu)
-        elif method == "optimization":
-            if obj_func is None or threshold is None:
-                raise TypeError("obj_func and threshold should be numeric value")
-
-            param = genextreme.fit(self.data, method="mle")
-            # then we use the result as starting value for your truncated Gumbel fit
-            param = so.fmin(
-                obj_func,
-                [threshold, param[0], param[1], param[2]],
-                args=(self.data,),
-                maxiter=500,
-                maxfun=500,
-            )
-            param = [param[1], param[2], param[3]]
-        else:
-            raise ValueError(f"The given: {method} does not exist")
-
-        param = {"loc": param[1], "scale": param[2], "shape": param[0]}
+        fit_key = (method, obj_func, threshold)
+        if fit_key not in self._fitted_parameters:
+            if method == "mle":
+                param = self._fit_mle()
+            elif method == "mm":
+                # start the moment matching from the L-moments estimates, from scipy's default guess (shape=1)
+                # the moments of the distribution are not finite and the fit fails.
+                x0 = _gev_lmoments_start(self._data_float64)
+                if x0 is None:
+                    param = genextreme.fit(self._data_float64, method=method)
+                else:
+                    shape, loc, scale = x0
+                    param = genextreme.fit(
+                        self._data_float64, shape, loc=loc, scale=scale, method=method
+                    )
+            elif method == "lmoments":
+                lm = Lmoments(self._data_float64)
+                lmu = lm.Lmom()
+                param = Lmoments.gev(lmu)
+            elif method == "optimization":
+                if obj_func is None or threshold is None:
+                    raise TypeError("obj_func and threshold should be numeric value")
+
+                param = self._fit_mle()
+                # then we use the result as starting value for your truncated GEV fit
+                if obj_func is GEV.truncated_distribution:
+                    # the threshold is kept at the given value (see `Gumbel.fit_model`), the data is split at the
+                    # threshold once, and the analytic gradient of the likelihood is used.
+                    split = self._split_at_threshold([threshold])
+
+                    def objective(p):
+                        nll, grad = GEV._truncated_nll_grad([threshold, *p], *split)
+                        return nll, grad[1:]
+
+                    res = so.minimize(
+                        objective,
+                        param,
+                        jac=True,
+                        method="L-BFGS-B",
+                        bounds=[(None, None), (None, None), (ninf, None)],
+                        options={"ftol": 1e-12, "gtol": 1e-9},
+                    )
+                    param = res.x
+                else:
+                    param = so.fmin(
+                        obj_func,
+                        [threshold, param[0], param[1], param[2]],
+                        args=(self._data_float64,),
+                        maxiter=500,
+                        maxfun=500,
+                    )
+                    # drop the threshold, [shape, loc, scale] is a view of the result.
+                    param = param[1:]
+            else:
+                raise ValueError(f"The given: {method} does not exist")
+
+            param = {"loc": param[1], "scale": param[2], "shape": param[0]}
+            self._fitted_parameters[fit_key] = param
+
+        param = self._fitted_parameters[fit_key].copy()
         self.parameters = param
 
         if test:
-            self.ks()
+            self.ks(verbose=True)
             # try:
             #     self.chisquare()
             # except ValueError:
@@ -1884,6 +2891,7 @@ class GEV(AbstractDistribution):
         self,
         cdf: Union[np.ndarray, List[float]] = None,
         parameters: Dict[str, Union[float, Any]] = None,
+        reduced_variate: np.ndarray = None,
     ) -> np.ndarray:
         """Theoretical Estimate.
 
@@ -1895,6 +2903,9 @@ class GEV(AbstractDistribution):
             location and scale parameters of the gumbel distribution.
         cdf: [list]
             cumulative distribution function/ Non-Exceedance probability.
+        reduced_variate: [np.ndarray], optional, default is None.
+            precomputed reduced variate -log(-log(cdf)) (see `PlottingPosition.reduced_variate`), used instead of the
+            cdf to avoid evaluating the logarithms again for the same cdf.
 
         Returns
         -------
@@ -1920,7 +2931,11 @@ class GEV(AbstractDistribution):
         if parameters is None:
             parameters = self.parameters
 
-        if any(cdf) < 0 or any(cdf) > 1:
+        if reduced_variate is not None:
+            return self._inv_cdf_reduced(reduced_variate, parameters)
+
+        cdf = np.asarray(cdf, dtype=np.float64)
+        if cdf.size and (cdf.min() < 0 or cdf.max() > 1):
             raise ValueError("cdf Value Invalid")
 
         q_th = self._inv_cdf(cdf, parameters)
@@ -1928,6 +2943,12 @@ class GEV(AbstractDistribution):
 
     @staticmethod
     def _inv_cdf(cdf: Union[np.ndarray, List[float]], parameters: Dict[str, float]):
+        # cdf=0/1 map to the bounds of the distribution (or -/+ inf)
+        return GEV._inv_cdf_reduced(PlottingPosition.reduced_variate(cdf), parameters)
+
+    @staticmethod
+    def _inv_cdf_reduced(reduced_variate: np.ndarray, parameters: Dict[str, float]):
+        """inverse cdf as a function of the reduced variate y = -log(-log(cdf))."""
         loc = parameters.get("loc")
         scale = parameters.get("scale")
         shape = parameters.get("shape")
@@ -1937,32 +2958,28 @@ class GEV(AbstractDistribution):
 
         if shape is None:
             raise ValueError("Shape parameter should not be None")
-        # q_th = list()
-        # for i in range(len(cdf)):
-        #     if cdf[i] <= 0 or cdf[i] >= 1:
-        #         if cdf[i] == 0 and shape < 0:
-        #             q_th.append(loc + scale / shape)
-        #         elif cdf[i] == 1 and shape > 0:
-        #             q_th.append(loc + scale / shape)
-        #         else:
-        #             raise ValueError(str(cdf[i]) + " value of cdf is Invalid")
-        #     # cdf = np.array(cdf)
-        #     Y = -np.log(-np.log(cdf[i]))
-        #     if shape != 0:
-        #         Y = (1 - np.exp(-1 * shape * Y)) / shape
-        #
-        #     q_th.append(loc + scale * Y)
-        # q_th = np.array(q_th)
-        # the main equation from scipy
-        q_th = genextreme.ppf(cdf, shape, loc=loc, scale=scale)
+        if abs(shape) < _GUMBEL_SHAPE_TOL:
+            # GEV is Gumbel distribution
+            return Gumbel._inv_cdf_reduced(reduced_variate, parameters)
+        with np.errstate(invalid="ignore", over="ignore"):
+            # (1 - exp(-shape * Y)) / shape, written with expm1 to keep the precision for small shapes
+            q_th = loc - scale * np.expm1(-shape * reduced_variate) / shape
         return q_th
 
-    def ks(self):
+    def _quantiles_at_plotting_position(self, parameters: Dict[str, float]) -> ndarray:
+        return self._inv_cdf_reduced(self.reduced_variate, parameters)
+
+    def ks(self, verbose: bool = False):
         """Kolmogorov-Smirnov (KS) test.
 
         The smaller the D static, the more likely that the two samples are drawn from the same distribution
         IF Pvalue < significance level ------ reject
 
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
         Returns
         -------
         Dstatic: [numeric]
@@ -1970,11 +2987,17 @@ class GEV(AbstractDistribution):
         Pvalue : [numeric]
             IF Pvalue < significance level ------ reject the null hypothesis
         """
-        return super().ks()
+        return super().ks(verbose=verbose)
+
+    def chisquare(self, verbose: bool = False) -> tuple:
+        """chisquare test
 
-    def chisquare(self) -> tuple:
-        """chisquare test"""
-        return super().chisquare()
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+        """
+        return super().chisquare(verbose=verbose)
 
     def confidence_interval(
         self,
@@ -1985,6 +3008,8 @@ class GEV(AbstractDistribution):
         state_function: callable = None,
         n_samples: int = 100,
         method: str = "lmoments",
+        workers: Union[int, Callable] = 1,
+        seed: Union[int, np.random.SeedSequence] = None,
         **kwargs,
     ) -> Union[
         Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, Figure, Axes]
@@ -2012,6 +3037,11 @@ class GEV(AbstractDistribution):
         method: [str]
             method used to fit the generated samples from the bootstrap method ["lmoments", "mle", "mm"]. Default is
             "lmoments".
+        workers: [int, callable], optional, default is 1.
+            number of processes (or a map-like callable) used to evaluate the bootstrap samples in parallel, see
+            `ConfidenceInterval.boot_strap`.
+        seed: [int, np.random.SeedSequence], optional, default is None.
+            seed of the random generator of the bootstrap, to get reproducible confidence intervals.
         plot_figure: bool, optional, default is False.
             to plot the confidence interval.
 
@@ -2055,34 +3085,41 @@ class GEV(AbstractDistribution):
             raise ValueError("Scale parameter is negative")
 
         if prob_non_exceed is None:
-            prob_non_exceed = PlottingPosition.weibul(self.data)
+            prob_non_exceed = self.cdf_weibul
+            reduced_variate = self.reduced_variate
         else:
             # if the prob_non_exceed is given, check if the length is the same as the data
-            if len(prob_non_exceed) != len(self.data):
+            if len(prob_non_exceed) != self._n:
                 raise ValueError(
                     "Length of prob_non_exceed does not match the length of data, use the `PlottingPosition.weibul(data)` "
                     "to the get the non-exceedance probability"
                 )
+            reduced_variate = PlottingPosition.reduced_variate(prob_non_exceed)
         if state_function is None:
             state_function = GEV.ci_func
+        # the axes are only used for plotting, they are not passed to the bootstrap state function.
+        ax = kwargs.pop("ax", None)
 
         ci = ConfidenceInterval.boot_strap(
             self.data,
             state_function=state_function,
             gevfit=parameters,
             F=prob_non_exceed,
+            reduced_variate=reduced_variate,
             alpha=alpha,
             n_samples=n_samples,
             method=method,
+            workers=workers,
+            seed=seed,
             **kwargs,
         )
         q_lower = ci["lb"]
         q_upper = ci["ub"]
 
         if plot_figure:
-            qth = self._inv_cdf(prob_non_exceed, parameters)
+            qth = self._inv_cdf_reduced(reduced_variate, parameters)
             fig, ax = Plot.confidence_level(
-                qth, self.data, q_lower, q_upper, alpha=alpha, **kwargs
+                qth, self.data, q_lower, q_upper, alpha=alpha, ax=ax, **kwargs
             )
             return q_upper, q_lower, fig, ax
         else:
@@ -2096,6 +3133,8 @@ class GEV(AbstractDistribution):
         fontsize=15,
         cdf: Union[np.ndarray, list] = None,
         parameters: Dict[str, Union[float, Any]] = None,
+        ax: Tuple[Axes, Axes] = None,
+        npoints: int = None,
     ) -> Tuple[Figure, Tuple[Axes, Axes]]:
         """Probability Plot.
 
@@ -2123,6 +3162,11 @@ class GEV(AbstractDistribution):
             X label string
         fig_size: [tuple]
             size of the pdf and cdf figure
+        ax: Tuple[Axes, Axes], optional, default is None.
+            existing (pdf, cdf) axes to draw the plots on, if not given a new figure is created.
+        npoints: int, optional, default is None.
+            number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+            values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -2160,20 +3204,17 @@ class GEV(AbstractDistribution):
             raise ValueError("Scale parameter is negative")
 
         if cdf is None:
-            cdf = PlottingPosition.weibul(self.data)
+            cdf = self.cdf_weibul
         else:
             # if the prob_non_exceed is given, check if the length is the same as the data
-            if len(cdf) != len(self.data):
+            if len(cdf) != self._n:
                 raise ValueError(
                     "Length of prob_non_exceed does not match the length of data, use the `PlottingPosition.weibul(data)` "
                     "to the get the non-exceedance probability"
                 )
 
-        q_x = np.linspace(
-            float(self.data_sorted[0]), 1.5 * float(self.data_sorted[-1]), 10000
-        )
-        pdf_fitted = self.pdf(parameters=parameters, data=q_x)
-        cdf_fitted = self.cdf(parameters=parameters, data=q_x)
+        q_x = _plot_grid(self.data, npoints)
+        pdf_fitted, cdf_fitted = self._pdf_cdf_eq(q_x, parameters)
 
         fig, ax = Plot.details(
             q_x,
@@ -2185,6 +3226,7 @@ class GEV(AbstractDistribution):
             xlabel=xlabel,
             ylabel=ylabel,
             fontsize=fontsize,
+            ax=ax,
         )
 
         return fig, ax
@@ -2207,12 +3249,17 @@ class GEV(AbstractDistribution):
             method: [str]
                 method used to fit the generated samples from the bootstrap method ["lmoments", "mle", "mm"]. Default is
                 "lmoments".
+            rng: [np.random.Generator], optional
+                random generator used to generate the sample, if not given the global numpy random state is used.
+            reduced_variate: [np.ndarray], optional
+                precomputed reduced variate -log(-log(F)), to avoid recomputing it for every bootstrap sample.
         """
         gevfit = kwargs["gevfit"]
         prob_non_exceed = kwargs["F"]
         method = kwargs["method"]
+        rng = kwargs.get("rng", np.random)
         # generate theoretical estimates based on a random cdf, and the dist parameters
-        sample = GEV._inv_cdf(np.random.rand(len(data)), gevfit)
+        sample = GEV._inv_cdf(rng.random(len(data)), gevfit)
 
         # get parameters based on the new generated sample
         dist = GEV(sample)
@@ -2224,7 +3271,10 @@ class GEV(AbstractDistribution):
         # T = np.linspace(0.1, 999, len(data)) + 1
         # coresponding theoretical estimate to T
         # prob_non_exceed = 1 - 1 / T
-        q_th = GEV._inv_cdf(prob_non_exceed, new_param)
+        reduced_variate = kwargs.get("reduced_variate")
+        if reduced_variate is None:
+            reduced_variate = PlottingPosition.reduced_variate(prob_non_exceed)
+        q_th = GEV._inv_cdf_reduced(reduced_variate, new_param)
 
         res = list(new_param.values())
         res.extend(q_th)
@@ -2501,7 +3551,8 @@ class GEV(AbstractDistribution):
 #         if scale <= 0:
 #             raise ValueError("Parameters Invalid")
 #
-#         if any(prob_non_exceed) < 0 or any(prob_non_exceed) > 1:
+#         prob_non_exceed = np.asarray(prob_non_exceed)
+#         if prob_non_exceed.size and (prob_non_exceed.min() < 0 or prob_non_exceed.max() > 1):
 #             raise ValueError("cdf Value Invalid")
 #
 #         # the main equation from scipy
@@ -2588,7 +3639,13 @@ class Exponential(AbstractDistribution):
         # if len(pdf) == 1:
         #     pdf = pdf[0]
 
-        pdf = expon.pdf(data, loc=loc, scale=scale)
+        # pdf = exp(-z) / scale for z >= 0, evaluated in place on z.
+        pdf = _standardize(data, loc, scale)
+        outside = pdf < 0
+        np.negative(pdf, out=pdf)
+        np.exp(pdf, out=pdf)
+        pdf /= pdf.dtype.type(scale)
+        pdf[outside] = 0.0
         return pdf
 
     def pdf(
@@ -2627,6 +3684,11 @@ class Exponential(AbstractDistribution):
                 Default is "pdf".
             fontsize: [int]
                 Default is 15
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -2729,7 +3791,13 @@ class Exponential(AbstractDistribution):
         # for i in range(0, len(cdf)):
         #     if cdf[i] < 0:
         #         cdf[i] = 0
-        cdf = expon.cdf(data, loc=loc, scale=scale)
+        # cdf = 1 - exp(-z) for z >= 0, evaluated in place on z.
+        cdf = _standardize(data, loc, scale)
+        outside = cdf < 0
+        np.negative(cdf, out=cdf)
+        np.expm1(cdf, out=cdf)
+        np.negative(cdf, out=cdf)
+        cdf[outside] = 0.0
         return cdf
 
     def cdf(
@@ -2770,6 +3838,11 @@ class Exponential(AbstractDistribution):
                 Default is "cdf".
             fontsize: [int]
                 Default is 15.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -2804,7 +3877,7 @@ class Exponential(AbstractDistribution):
         method: str = "mle",
         obj_func=None,
         threshold: Union[int, float, None] = None,
-        test: bool = True,
+        test: bool = False,
     ) -> Dict[str, float]:
         """fit_model.
 
@@ -2828,7 +3901,7 @@ class Exponential(AbstractDistribution):
         method : [string]
             'mle', 'mm', 'lmoments', optimization
         test: bool
-            Default is True
+            True to run the Kolmogorov-Smirnov test on the fitted parameters. Default is False.
 
         Returns
         -------
@@ -2869,41 +3942,17 @@ class Exponential(AbstractDistribution):
         # #first we make a simple Gumbel fit
         # Par1 = so.fmin(obj_func, [0.5,0.5], args=(np.array(data),))
         method = super().fit_model(method=method)
-
-        if method == "mle" or method == "mm":
-            param = list(expon.fit(self.data, method=method))
-        elif method == "lmoments":
-            lm = Lmoments(self.data)
-            lmu = lm.Lmom()
-            param = Lmoments.exponential(lmu)
-        elif method == "optimization":
-            if obj_func is None or threshold is None:
-                raise TypeError("obj_func and threshold should be numeric value")
-
-            param = expon.fit(self.data, method="mle")
-            # then we use the result as starting value for your truncated Gumbel fit
-            param = so.fmin(
-                obj_func,
-                [threshold, param[0], param[1]],
-                args=(self.data,),
-                maxiter=500,
-                maxfun=500,
-            )
-            param = [param[1], param[2]]
-        else:
-            raise ValueError(f"The given: {method} does not exist")
-
-        param = {"loc": param[0], "scale": param[1]}
-        self.parameters = param
-
-        if test:
-            self.ks()
-            # try:
-            #     self.chisquare()
-            # except ValueError:
-            #     print("chisquare test failed")
-
-        return param
+        return self._fit_loc_scale(
+            {
+                "mle": _expon_mle,
+                "mm": _expon_mm,
+                "lmoments": lambda data: Lmoments.exponential(Lmoments(data).Lmom()),
+            },
+            method,
+            obj_func,
+            threshold,
+            test,
+        )
 
     def inverse_cdf(
         self,
@@ -2956,19 +4005,28 @@ class Exponential(AbstractDistribution):
         if scale <= 0:
             raise ValueError("Parameters Invalid")
 
-        if any(cdf) < 0 or any(cdf) > 1:
+        cdf = np.asarray(cdf, dtype=np.float64)
+        if cdf.size and (cdf.min() < 0 or cdf.max() > 1):
             raise ValueError("cdf Value Invalid")
 
-        # the main equation from scipy
-        q_th = expon.ppf(cdf, loc=loc, scale=scale)
+        # q_th = loc - scale * log(1 - cdf), evaluated in place on one array.
+        q_th = np.negative(cdf)
+        np.log1p(q_th, out=q_th)
+        q_th *= -scale
+        q_th += loc
         return q_th
 
-    def ks(self):
+    def ks(self, verbose: bool = False):
         """Kolmogorov-Smirnov (KS) test.
 
         The smaller the D static, the more likely that the two samples are drawn from the same distribution
         IF Pvalue < significance level ------ reject
 
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
         Returns
         -------
             Dstatic: [numeric]
@@ -2976,11 +4034,17 @@ class Exponential(AbstractDistribution):
             Pvalue : [numeric]
                 IF Pvalue < significance level ------ reject the null hypothesis
         """
-        return super().ks()
+        return super().ks(verbose=verbose)
+
+    def chisquare(self, verbose: bool = False) -> tuple:
+        """chisquare test
 
-    def chisquare(self) -> tuple:
-        """chisquare test"""
-        return super().chisquare()
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+        """
+        return super().chisquare(verbose=verbose)
 
 
 class Normal(AbstractDistribution):
@@ -3028,7 +4092,12 @@ class Normal(AbstractDistribution):
         scale = parameters.get("scale")
         if scale <= 0:
             raise ValueError("Scale parameter is negative")
-        pdf = norm.pdf(data, loc=loc, scale=scale)
+        # pdf = exp(-z**2 / 2) / (scale * sqrt(2 pi)), evaluated in place on z.
+        pdf = _standardize(data, loc, scale)
+        pdf *= pdf
+        pdf *= -0.5
+        np.exp(pdf, out=pdf)
+        pdf /= pdf.dtype.type(scale * np.sqrt(2 * np.pi))
 
         return pdf
 
@@ -3068,6 +4137,11 @@ class Normal(AbstractDistribution):
                 Default is "pdf".
             fontsize: [int]
                 Default is 15
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -3100,7 +4174,8 @@ class Normal(AbstractDistribution):
         if loc <= 0:
             raise ValueError("Threshold parameter should be greater than zero")
 
-        cdf = norm.cdf(data, loc=loc, scale=scale)
+        cdf = _standardize(data, loc, scale)
+        ndtr(cdf, out=cdf)
         return cdf
 
     def cdf(
@@ -3139,6 +4214,11 @@ class Normal(AbstractDistribution):
                 Default is "cdf".
             fontsize: [int]
                 Default is 15.
+            ax: matplotlib.axes.Axes, optional, default is None.
+                existing axes to draw the plot on, if not given a new figure is created.
+            npoints: int, optional, default is None.
+                number of points of the grid the fitted distribution is plotted on, if not given 4 * the number of
+                values (at least 200, at most 10000) is used. The grid is log-spaced for positive data.
 
         Returns
         -------
@@ -3163,7 +4243,7 @@ class Normal(AbstractDistribution):
         method: str = "mle",
         obj_func=None,
         threshold: Union[int, float, None] = None,
-        test: bool = True,
+        test: bool = False,
     ) -> Dict[str, float]:
         """fit_model.
 
@@ -3187,7 +4267,7 @@ class Normal(AbstractDistribution):
         method: [string]
             'mle', 'mm', 'lmoments', optimization
         test: bool
-            Default is True
+            True to run the Kolmogorov-Smirnov test on the fitted parameters. Default is False.
 
         Returns
         -------
@@ -3198,41 +4278,18 @@ class Normal(AbstractDistribution):
         # #first we make a simple Gumbel fit
         # Par1 = so.fmin(obj_func, [0.5,0.5], args=(np.array(data),))
         method = super().fit_model(method=method)
-
-        if method == "mle" or method == "mm":
-            param = list(norm.fit(self.data, method=method))
-        elif method == "lmoments":
-            lm = Lmoments(self.data)
-            lmu = lm.Lmom()
-            param = Lmoments.normal(lmu)
-        elif method == "optimization":
-            if obj_func is None or threshold is None:
-                raise TypeError("obj_func and threshold should be numeric value")
-
-            param = norm.fit(self.data, method="mle")
-            # then we use the result as starting value for your truncated Gumbel fit
-            param = so.fmin(
-                obj_func,
-                [threshold, param[0], param[1]],
-                args=(self.data,),
-                maxiter=500,
-                maxfun=500,
-            )
-            param = [param[1], param[2]]
-        else:
-            raise ValueError(f"The given: {method} does not exist")
-
-        param = {"loc": param[0], "scale": param[1]}
-        self.parameters = param
-
-        if test:
-            self.ks()
-            # try:
-            #     self.chisquare()
-            # except ValueError:
-            #     print("chisquare test failed")
-
-        return param
+        return self._fit_loc_scale(
+            {
+                "mle": _norm_mle,
+                # the first two moments of the normal distribution are its parameters, both methods coincide.
+                "mm": _norm_mle,
+                "lmoments": lambda data: Lmoments.normal(Lmoments(data).Lmom()),
+            },
+            method,
+            obj_func,
+            threshold,
+            test,
+        )
 
     def inverse_cdf(
         self,
@@ -3269,19 +4326,27 @@ class Normal(AbstractDistribution):
         if scale <= 0:
             raise ValueError("Parameters Invalid")
 
-        if any(cdf) < 0 or any(cdf) > 1:
+        cdf = np.asarray(cdf, dtype=np.float64)
+        if cdf.size and (cdf.min() < 0 or cdf.max() > 1):
             raise ValueError("cdf Value Invalid")
 
-        # the main equation from scipy
-        q_th = norm.ppf(cdf, loc=loc, scale=scale)
+        # q_th = loc + scale * ndtri(cdf), scaled and shifted in place on the output of ndtri.
+        q_th = np.asarray(ndtri(cdf))
+        q_th *= scale
+        q_th += loc
         return q_th
 
-    def ks(self):
+    def ks(self, verbose: bool = False):
         """Kolmogorov-Smirnov (KS) test.
 
         The smaller the D static, the more likely that the two samples are drawn from the same distribution
         IF Pvalue < significance level ------ reject
 
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+
         Returns
         -------
         Dstatic: [numeric]
@@ -3289,11 +4354,17 @@ class Normal(AbstractDistribution):
         Pvalue: [numeric]
             IF Pvalue < significance level ------ reject the null hypothesis
         """
-        return super().ks()
+        return super().ks(verbose=verbose)
+
+    def chisquare(self, verbose: bool = False) -> tuple:
+        """chisquare test
 
-    def chisquare(self) -> tuple:
-        """chisquare test"""
-        return super().chisquare()
+        Parameters
+        ----------
+        verbose: bool, optional, default is False.
+            True to print the test results.
+        """
+        return super().chisquare(verbose=verbose)
 
 
 class Distributions:
@@ -54,6 +54,7 @@ def ams_analysis(
     obj_func: callable = None,
     quartile: float = 0,
     alpha: float = 0.1,
+    test: bool = True,
 ) -> Tuple[DataFrame, DataFrame]:
     """Annual Maximum Series analysis.
 
@@ -89,6 +90,9 @@ def ams_analysis(
         value, the threshold value will be calculated as the quartile coresponding to the value of this parameter.
     alpha: float, optional, Default is [0.1].
         alpha or Significance level is a value of the confidence interval.
+    test: bool, optional, Default is True.
+        True to run (and print) the goodness-of-fit test of `fit_model` after each fit, False to skip it when
+        fitting many gauges.
 
     Returns
     -------
@@ -301,6 +305,7 @@ def ams_analysis(
                 method=method,
                 obj_func=obj_func,
                 threshold=threshold,
+                test=test,
             )
         except Exception as e:
             logger.warning(
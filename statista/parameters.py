@@ -116,108 +116,62 @@ class Lmoments:
         if nmom <= 0:
             raise ValueError("Invalid number of Sample L-Moments")
 
-        sample = sorted(sample)
-        n = len(sample)
+        sample = np.sort(np.asarray(sample, dtype=np.float64))
+        n = sample.size
 
         if n < nmom:
             raise ValueError("Insufficient length of data for specified nmoments")
 
-        # coefl1 = 1.0 / self._comb(n, 1)  # coefl1 = 1/n
-        # suml1 = sum(sample)
-        # l_moment_1 = coefl1 * suml1  # l_moment_1 = mean(sample)
         l_moment_1 = np.mean(sample)
         if nmom == 1:
             return [l_moment_1]
 
-        # comb terms appear elsewhere, this will decrease calc time
-        # for nmom > 2, and shouldn't decrease time for nmom == 2
-        # comb(sample,1) = sample
-        # for i in range(1,n+1):
-        # #        comb1.append(comb(i-1,1))
-        # #        comb2.append(comb(n-i,1))
-        # Can be simplified to comb1 = range(0,n)
-
-        comb1 = range(0, n)
-        comb2 = range(n - 1, -1, -1)
+        # the comb terms comb(i, k) and comb(n - 1 - i, k) of every sorted value are evaluated once as arrays,
+        # and each L-moment is the dot product of its coefficients with the sorted sample.
+        # comb1 = comb(i, 1), comb2 = comb(n - 1 - i, 1) = reversed comb1
+        comb1 = np.arange(n, dtype=np.float64)
+        comb2 = comb1[::-1]
 
         coefl2 = 0.5 * 1.0 / self._comb(n, 2)
-        xtrans = []
-        for i in range(0, n):
-            coef_temp = comb1[i] - comb2[i]
-            xtrans.append(coef_temp * sample[i])
-
-        l_moment_2 = coefl2 * sum(xtrans)
+        l_moment_2 = coefl2 * np.dot(comb1 - comb2, sample)
 
         if nmom == 2:
             return [l_moment_1, l_moment_2]
 
         # Calculate Third order
-        # comb terms appear elsewhere, this will decrease calc time
-        # for nmom > 2, and shouldn't decrease time for nmom == 2
-        # comb3 = comb(i-1,2)
-        # comb4 = comb3.reverse()
-        comb3 = []
-        comb4 = []
-        for i in range(0, n):
-            comb_temp = self._comb(i, 2)
-            comb3.append(comb_temp)
-            comb4.insert(0, comb_temp)
+        # comb3 = comb(i, 2), comb4 = reversed comb3
+        comb3 = _spsp.comb(comb1, 2)
+        comb4 = comb3[::-1]
 
         coefl3 = 1.0 / 3 * 1.0 / self._comb(n, 3)
-        xtrans = []
-        for i in range(0, n):
-            coef_temp = comb3[i] - 2 * comb1[i] * comb2[i] + comb4[i]
-            xtrans.append(coef_temp * sample[i])
-
-        l_moment_3 = coefl3 * sum(xtrans) / l_moment_2
+        coef_temp = comb3 - 2 * comb1 * comb2 + comb4
+        l_moment_3 = coefl3 * np.dot(coef_temp, sample) / l_moment_2
 
         if nmom == 3:
             return [l_moment_1, l_moment_2, l_moment_3]
 
         # Calculate Fourth order
-        # comb5 = comb(i-1,3)
-        # comb6 = comb(n-i,3)
-        comb5 = []
-        comb6 = []
-        for i in range(0, n):
-            comb_temp = self._comb(i, 3)
-            comb5.append(comb_temp)
-            comb6.insert(0, comb_temp)
+        # comb5 = comb(i, 3), comb6 = reversed comb5
+        comb5 = _spsp.comb(comb1, 3)
+        comb6 = comb5[::-1]
 
         coefl4 = 1.0 / 4 * 1.0 / self._comb(n, 4)
-        xtrans = []
-        for i in range(0, n):
-            coef_temp = (
-                comb5[i] - 3 * comb3[i] * comb2[i] + 3 * comb1[i] * comb4[i] - comb6[i]
-            )
-            xtrans.append(coef_temp * sample[i])
-
-        l_moment_4 = coefl4 * sum(xtrans) / l_moment_2
+        coef_temp = comb5 - 3 * comb3 * comb2 + 3 * comb1 * comb4 - comb6
+        l_moment_4 = coefl4 * np.dot(coef_temp, sample) / l_moment_2
 
         if nmom == 4:
             return [l_moment_1, l_moment_2, l_moment_3, l_moment_4]
 
         # Calculate Fifth order
-        comb7 = []
-        comb8 = []
-        for i in range(0, n):
-            comb_temp = self._comb(i, 4)
-            comb7.append(comb_temp)
-            comb8.insert(0, comb_temp)
+        # comb7 = comb(i, 4), comb8 = reversed comb7
+        comb7 = _spsp.comb(comb1, 4)
+        comb8 = comb7[::-1]
 
         coefl5 = 1.0 / 5 * 1.0 / self._comb(n, 5)
-        xtrans = []
-        for i in range(0, n):
-            coef_temp = (
-                comb7[i]
-                - 4 * comb5[i] * comb2[i]
-                + 6 * comb3[i] * comb4[i]
-                - 4 * comb1[i] * comb6[i]
-                + comb8[i]
-            )
-            xtrans.append(coef_temp * sample[i])
-
-        l_moment_5 = coefl5 * sum(xtrans) / l_moment_2
+        coef_temp = (
+            comb7 - 4 * comb5 * comb2 + 6 * comb3 * comb4 - 4 * comb1 * comb6 + comb8
+        )
+        l_moment_5 = coefl5 * np.dot(coef_temp, sample) / l_moment_2
 
         if nmom == 5:
             return [l_moment_1, l_moment_2, l_moment_3, l_moment_4, l_moment_5]
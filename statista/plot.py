@@ -2,13 +2,22 @@
 
 from typing import Union, Tuple
 from numbers import Number
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends import BackendFilter, backend_registry
 from matplotlib import gridspec
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import numpy as np
 
 
+def _show():
+    """Show the new figures, only with an interactive backend (with Agg and the file backends it is a no-op)."""
+    non_interactive = backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+    if matplotlib.get_backend().lower() not in non_interactive:
+        plt.show()
+
+
 class Plot:
     """plot."""
 
@@ -24,6 +33,7 @@ class Plot:
         xlabel: str = "Actual data",
         ylabel: str = "pdf",
         fontsize: int = 11,
+        ax: Axes = None,
     ) -> Tuple[Figure, Axes]:
         """pdf.
 
@@ -36,6 +46,8 @@ class Plot:
         xlabel
         ylabel
         fontsize
+        ax: matplotlib.axes.Axes, optional, default is None.
+            existing axes to draw the plot on, if not given a new figure is created (and shown).
 
         Returns
         -------
@@ -44,17 +56,22 @@ class Plot:
         Axes:
             matplotlib plot axis
         """
-        fig = plt.figure(figsize=fig_size)
-        # gs = gridspec.GridSpec(nrows=1, ncols=2, figure=fig)
-        # Plot the histogram and the fitted distribution, save it for each gauge.
-        ax = fig.add_subplot()
+        new_figure = ax is None
+        if new_figure:
+            fig = plt.figure(figsize=fig_size)
+            # gs = gridspec.GridSpec(nrows=1, ncols=2, figure=fig)
+            # Plot the histogram and the fitted distribution, save it for each gauge.
+            ax = fig.add_subplot()
+        else:
+            fig = ax.figure
         ax.plot(qx, pdf_fitted, "-", color="#27408B", linewidth=2)
         ax.hist(
             data_sorted, density=True, histtype="stepfilled", color="#DC143C"
         )  # , alpha=0.2
         ax.set_xlabel(xlabel, fontsize=fontsize)
         ax.set_ylabel(ylabel, fontsize=fontsize)
-        plt.show()
+        if new_figure:
+            _show()
         return fig, ax
 
     @staticmethod
@@ -67,6 +84,7 @@ class Plot:
         xlabel="Actual data",
         ylabel="cdf",
         fontsize=11,
+        ax: Axes = None,
     ) -> Tuple[Figure, Axes]:
         """cdf.
 
@@ -80,6 +98,8 @@ class Plot:
         xlabel
         ylabel
         fontsize
+        ax: matplotlib.axes.Axes, optional, default is None.
+            existing axes to draw the plot on, if not given a new figure is created (and shown).
 
         Returns
         -------
@@ -88,8 +108,12 @@ class Plot:
         Axis:
             matplotlib plot axis
         """
-        fig = plt.figure(figsize=fig_size)
-        ax = fig.add_subplot()
+        new_figure = ax is None
+        if new_figure:
+            fig = plt.figure(figsize=fig_size)
+            ax = fig.add_subplot()
+        else:
+            fig = ax.figure
         ax.plot(
             qx, cdf_fitted, "-", label="Estimated CDF", color="#27408B", linewidth=2
         )
@@ -102,8 +126,9 @@ class Plot:
         )
         ax.set_xlabel(xlabel, fontsize=fontsize)
         ax.set_ylabel(ylabel, fontsize=fontsize)
-        plt.legend(fontsize=fontsize, framealpha=1)
-        plt.show()
+        ax.legend(fontsize=fontsize, framealpha=1)
+        if new_figure:
+            _show()
         return fig, ax
 
     @staticmethod
@@ -117,6 +142,7 @@ class Plot:
         xlabel: str = "Actual data",
         ylabel: str = "cdf",
         fontsize: int = 11,
+        ax: Tuple[Axes, Axes] = None,
     ) -> Tuple[Figure, Tuple[Axes, Axes]]:
         """details.
 
@@ -139,6 +165,8 @@ class Plot:
             Label for y-axis.
         fontsize: int, optional, default=11
             Font size.
+        ax: Tuple[Axes, Axes], optional, default is None.
+            existing (pdf, cdf) axes to draw the plots on, if not given a new figure is created (and shown).
 
         Returns
         -------
@@ -147,23 +175,30 @@ class Plot:
         Tuple[Axes, Axes]:
             matplotlib plot axes
         """
-        fig = plt.figure(figsize=fig_size)
-        gs = gridspec.GridSpec(nrows=1, ncols=2, figure=fig)
-        # Plot the histogram and the fitted distribution, save it for each gauge.
-        ax1 = fig.add_subplot(gs[0, 0])
+        new_figure = ax is None
+        if new_figure:
+            fig = plt.figure(figsize=fig_size)
+            gs = gridspec.GridSpec(nrows=1, ncols=2, figure=fig)
+            # Plot the histogram and the fitted distribution, save it for each gauge.
+            ax1 = fig.add_subplot(gs[0, 0])
+            ax2 = fig.add_subplot(gs[0, 1])
+        else:
+            ax1, ax2 = ax
+            fig = ax1.figure
         ax1.plot(qx, pdf, "-", color="#27408B", linewidth=2)
         ax1.hist(q_act, density=True, histtype="stepfilled", color="#DC143C")
         ax1.set_xlabel(xlabel, fontsize=fontsize)
         ax1.set_ylabel("pdf", fontsize=fontsize)
 
-        ax2 = fig.add_subplot(gs[0, 1])
         ax2.plot(qx, cdf_fitted, "-", color="#27408B", linewidth=2)
 
-        q_act.sort()
+        # sort a copy, the actual data given by the caller should not be modified.
+        q_act = np.sort(q_act)
         ax2.scatter(q_act, cdf, color="#DC143C", facecolors="none")
         ax2.set_xlabel(xlabel, fontsize=fontsize)
         ax2.set_ylabel(ylabel, fontsize=15)
-        plt.show()
+        if new_figure:
+            _show()
         return fig, (ax1, ax2)
 
     @staticmethod
@@ -176,6 +211,7 @@ class Plot:
         fontsize: int = 11,
         alpha: Number = None,
         marker_size: int = 10,
+        ax: Axes = None,
     ) -> Tuple[Figure, Axes]:
         """details.
 
@@ -197,6 +233,8 @@ class Plot:
             Font size.
         marker_size: int, default is 10.
             Size of the markers for the upper and lower bounds.
+        ax: matplotlib.axes.Axes, optional, default is None.
+            existing axes to draw the plot on, if not given a new figure is created (and shown).
 
         Returns
         -------
@@ -205,10 +243,14 @@ class Plot:
         Axes:
             matplotlib plot axes
         """
-        q_act.sort()
+        q_act = np.sort(q_act)
 
-        fig = plt.figure(figsize=fig_size)
-        ax = fig.add_subplot()
+        new_figure = ax is None
+        if new_figure:
+            fig = plt.figure(figsize=fig_size)
+            ax = fig.add_subplot()
+        else:
+            fig = ax.figure
         ax.plot(qth, qth, "-.", color="#3D59AB", linewidth=2, label="Theoretical Data")
         # confidence interval
         ax.plot(
@@ -238,5 +280,6 @@ class Plot:
         ax.legend(fontsize=fontsize, framealpha=1)
         ax.set_xlabel("Theoretical Values", fontsize=fontsize)
         ax.set_ylabel("Actual Values", fontsize=fontsize)
-        plt.show()
+        if new_figure:
+            _show()
         return fig, ax
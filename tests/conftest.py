@@ -6,12 +6,14 @@ from pandas import DataFrame
 import pytest
 
 
-@pytest.fixture(scope="module")
+# the time series are read once for the whole test session, the expected values of the tests are based on the
+# values parsed by pandas.
+@pytest.fixture(scope="session")
 def time_series1() -> list:
     return pd.read_csv("examples/data/time_series1.txt", header=None)[0].tolist()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def time_series2() -> list:
     return pd.read_csv("examples/data/time_series2.txt", header=None)[0].tolist()
 
@@ -35,9 +37,9 @@ def gev_dist_parameters() -> Dict[str, Dict[str, float]]:
             "shape": -0.1614793298009645,
         },
         "mle": {
-            "loc": 16.303264414285966,
-            "scale": 0.5411914328865949,
-            "shape": -0.5013795739666272,
+            "loc": 16.303256594621,
+            "scale": 0.5411836829036549,
+            "shape": -0.5013497498212153,
         },
     }
 
@@ -137,7 +139,7 @@ def exp_dist_parameters() -> Dict[str, Dict[str, float]]:
 @pytest.fixture(scope="module")
 def gum_dist_parameters() -> Dict[str, Dict[str, float]]:
     return {
-        "mle": {"loc": 466.1208189815563, "scale": 214.3001449633138},
+        "mle": {"loc": 466.1208189815563, "scale": 214.3001449633139},
         "lmoments": {"loc": 463.8040433832974, "scale": 220.0724922663106},
     }
 
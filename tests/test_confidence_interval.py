@@ -28,3 +28,68 @@ def test_boot_strap(
     assert isinstance(lb, np.ndarray)
     assert isinstance(ub, np.ndarray)
     assert lb.shape == ub.shape == (len(time_series1),)
+
+
+def test_boot_strap_workers(
+    time_series1: list,
+    ci_cdf: np.ndarray,
+    ci_param: Dict[str, float],
+):
+    """the bootstrap samples evaluated in parallel processes and with a map-like callable."""
+    for workers in [2, map]:
+        ci = ConfidenceInterval.boot_strap(
+            time_series1,
+            state_function=GEV.ci_func,
+            gevfit=ci_param,
+            n_samples=len(time_series1),
+            F=ci_cdf,
+            method="lmoments",
+            workers=workers,
+        )
+        lb = ci["lb"]
+        ub = ci["ub"]
+        assert lb.shape == ub.shape == (len(time_series1),)
+        assert np.all(np.isfinite(lb)) and np.all(np.isfinite(ub))
+
+
+def test_boot_strap_seed(
+    time_series1: list,
+    ci_cdf: np.ndarray,
+    ci_param: Dict[str, float],
+):
+    """the same seed gives the same confidence interval, serially and in parallel."""
+    kwargs = dict(
+        state_function=GEV.ci_func,
+        gevfit=ci_param,
+        n_samples=len(time_series1),
+        F=ci_cdf,
+        method="lmoments",
+        seed=42,
+    )
+    ci_1 = ConfidenceInterval.boot_strap(time_series1, **kwargs)
+    ci_2 = ConfidenceInterval.boot_strap(time_series1, workers=2, **kwargs)
+    np.testing.assert_array_equal(ci_1["lb"], ci_2["lb"])
+    np.testing.assert_array_equal(ci_1["ub"], ci_2["ub"])
+
+
+def test_scipy_boot_strap(time_series1: list):
+    """non-parametric bootstrap of a statistic delegated to scipy."""
+    ci = ConfidenceInterval.scipy_boot_strap(
+        time_series1, np.median, alpha=0.1, n_samples=1000, seed=1
+    )
+    assert ci["lb"] < np.median(time_series1) < ci["ub"]
+    assert ci["standard_error"] > 0
+    ci_2 = ConfidenceInterval.scipy_boot_strap(
+        time_series1, np.median, alpha=0.1, n_samples=1000, seed=1
+    )
+    assert ci["lb"] == ci_2["lb"] and ci["ub"] == ci_2["ub"]
+
+
+def test_bs_indexes(time_series1: list):
+    """the indexes are drawn from the seeded generator."""
+    indexes = list(ConfidenceInterval.bs_indexes(time_series1, n_samples=5, seed=3))
+    assert len(indexes) == 5
+    assert all(i.shape == (len(time_series1),) for i in indexes)
+    assert all(i.min() >= 0 and i.max() < len(time_series1) for i in indexes)
+    indexes_2 = list(ConfidenceInterval.bs_indexes(time_series1, n_samples=5, seed=3))
+    np.testing.assert_array_equal(indexes, indexes_2)
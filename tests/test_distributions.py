@@ -3,11 +3,15 @@
 import matplotlib
 
 matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import warnings
 from typing import List, Dict
 
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from scipy.optimize import approx_fprime
+from scipy.stats import expon, genextreme, gumbel_r, ks_2samp, norm
 
 from statista.distributions import (
     GEV,
@@ -16,6 +20,10 @@ from statista.distributions import (
     Exponential,
     Normal,
     Distributions,
+    _expon_mle,
+    _gumbel_mle,
+    _ks_2samp_sorted,
+    _norm_mle,
 )
 import pytest
 
@@ -29,6 +37,9 @@ class TestPlottingPosition:
         assert isinstance(cdf, np.ndarray)
         rp = PlottingPosition.weibul(time_series1, return_period=True)
         assert isinstance(rp, np.ndarray)
+        cdf_32 = PlottingPosition.weibul(time_series1, dtype=np.float32)
+        assert cdf_32.dtype == np.float32
+        np.testing.assert_allclose(cdf_32, cdf, rtol=1e-7)
 
     def test_plotting_position_rp(
         self,
@@ -38,6 +49,19 @@ class TestPlottingPosition:
         rp = PlottingPosition.return_period(cdf)
         assert isinstance(rp, np.ndarray)
 
+    def test_plotting_position_reduced_variate(
+        self,
+        time_series1: list,
+    ):
+        cdf = PlottingPosition.weibul(time_series1)
+        y = PlottingPosition.reduced_variate(cdf)
+        np.testing.assert_allclose(y, -np.log(-np.log(cdf)))
+        dist = Gumbel(time_series1, {"loc": 16.0, "scale": 0.7})
+        np.testing.assert_array_equal(dist.reduced_variate, y)
+        np.testing.assert_allclose(
+            dist.inverse_cdf(reduced_variate=y), dist.inverse_cdf(cdf)
+        )
+
 
 class TestAbstractDistribution:
     def test_abstract_distribution(self, time_series1: list, gev_dist_parameters):
@@ -56,6 +80,20 @@ class TestAbstractDistribution:
         text_3 = "\n                    Dataset of 27 value\n                    min: 15.790480003140171\n                    max: 19.39645340792385\n                    mean: 16.929171461473548\n                    median: 16.626465201654593\n                    mode: 15.999737471905252\n                    std: 1.0211514099144634\n                    Distribution : Gumbel\n                    parameters: {'loc': 16.392889171307772, 'scale': 0.7005442761744839, 'shape': -0.1614793298009645}\n                    \n                Distribution : Gumbel\n                parameters: {'loc': 16.392889171307772, 'scale': 0.7005442761744839, 'shape': -0.1614793298009645}\n                "
         assert str(dist) == text_3
 
+    def test_ks_2samp_sorted(self, time_series2: list):
+        rng = np.random.default_rng(5)
+        x = np.sort(np.asarray(time_series2, dtype=np.float64))
+        for y in [
+            np.sort(rng.normal(x.mean(), x.std(), x.size)),
+            np.sort(np.round(rng.normal(x.mean(), x.std(), x.size), -2)),
+            x.copy(),
+            np.sort(rng.normal(size=x.size + 3)),
+        ]:
+            statistic, pvalue = _ks_2samp_sorted(x, y)
+            test = ks_2samp(x, y)
+            assert statistic == test.statistic
+            assert pvalue == test.pvalue
+
 
 class TestGumbel:
     def test_create_instance(
@@ -64,6 +102,8 @@ class TestGumbel:
     ):
         dist = Gumbel(time_series1)
         assert isinstance(dist.data, np.ndarray)
+        assert dist.data.dtype == np.float64
+        assert dist.data.flags["C_CONTIGUOUS"]
         assert isinstance(dist.data_sorted, np.ndarray)
         assert dist.parameters is None
 
@@ -72,6 +112,26 @@ class TestGumbel:
         with pytest.raises(TypeError):
             dist = Gumbel(data=data)
 
+    def test_create_instance_float32(
+        self,
+        time_series2: list,
+        gum_dist_parameters: Dict[str, float],
+    ):
+        dist = Gumbel(time_series2, dtype=np.float32)
+        assert dist.data.dtype == np.float32
+        assert dist.cdf_weibul.dtype == np.float32
+        # the parameters are fitted in float64.
+        param = dist.fit_model(method="lmoments", test=False)
+        for key, val in gum_dist_parameters["lmoments"].items():
+            assert param[key] == pytest.approx(val, rel=1e-5)
+        pdf = dist.pdf()
+        assert pdf.dtype == np.float32
+        np.testing.assert_allclose(
+            pdf, Gumbel(time_series2).pdf(parameters=param), rtol=1e-4
+        )
+        with pytest.raises(ValueError):
+            Gumbel(time_series2, dtype=np.int64)
+
     def test_create_instance_with_wrong_parameter_type(self):
         parameters = [1, 2, 3]
         with pytest.raises(TypeError):
@@ -105,6 +165,40 @@ class TestGumbel:
             assert dist.parameters.get("scale") is not None
             assert param == gum_dist_parameters[method]
 
+    def test_fit_model_cached(
+        self,
+        time_series2: list,
+        gum_dist_parameters: Dict[str, float],
+    ):
+        dist = Gumbel(time_series2)
+        first = dist.fit_model(method="mle", test=False)
+        dist.fit_model(method="lmoments", test=False)
+        second = dist.fit_model(method="mle", test=False)
+        assert first == second == gum_dist_parameters["mle"]
+        # the cached parameters are copied.
+        assert first is not second
+        assert dist.parameters == gum_dist_parameters["mle"]
+
+    def test_gumbel_mle(self, time_series1: list, time_series2: list):
+        for data in [time_series1, time_series2]:
+            data = np.asarray(data, dtype=np.float64)
+            scale = data.std()
+            loc, scale_mle = _gumbel_mle(data, scale)
+            expected = gumbel_r.fit(data, loc=data.mean(), scale=scale)
+            assert loc == expected[0]
+            assert scale_mle == expected[1]
+            param = Gumbel(data).fit_model(method="mle", test=False)
+            assert all(type(i) is float for i in param.values())
+
+    def test_fit_mle_small_data(self):
+        # too few values for the L-moments start, and constant data, are fitted from scipy's starting values.
+        data = [1.0, 2.0, 4.0]
+        param = Gumbel(data).fit_model(method="mle", test=False)
+        np.testing.assert_allclose(list(param.values()), gumbel_r.fit(data))
+        with np.errstate(all="ignore"):
+            param = Gumbel([3.0] * 6).fit_model(method="mle", test=False)
+        assert list(param.keys()) == ["loc", "scale"]
+
     def test_parameter_estimation_optimization(
         self,
         time_series2: list,
@@ -121,6 +215,23 @@ class TestGumbel:
         assert all(i in param.keys() for i in ["loc", "scale"])
         assert dist.parameters.get("loc") is not None
         assert dist.parameters.get("scale") is not None
+        # the threshold is kept at the given value, the fit is the minimum of the truncated likelihood.
+        assert param["loc"] == pytest.approx(468.5858701, rel=1e-6)
+        assert param["scale"] == pytest.approx(219.2831671, rel=1e-6)
+
+    def test_truncated_nll_grad(
+        self,
+        time_series2: list,
+    ):
+        dist = Gumbel(time_series2)
+        for param in [[600.0, 460.0, 220.0], [350.0, 400.0, 200.0]]:
+            split = dist._split_at_threshold(param)
+            nll, grad = Gumbel._truncated_nll_grad(param, *split)
+            assert nll == pytest.approx(Gumbel._truncated_nll(param, *split))
+            num_grad = approx_fprime(
+                np.array(param), lambda p: Gumbel._truncated_nll(p, *split)
+            )
+            np.testing.assert_allclose(grad, num_grad, rtol=1e-4, atol=1e-6)
 
     def test_ks(
         self,
@@ -134,6 +245,32 @@ class TestGumbel:
         assert dstatic == 0.07407407407407407
         assert pvalue == 0.9987375782247235
 
+    def test_ks_verbose(
+        self,
+        time_series2: list,
+        gum_dist_parameters: Dict[str, Dict[str, float]],
+        capsys,
+    ):
+        dist = Gumbel(time_series2, gum_dist_parameters["mle"])
+        dist.ks()
+        assert capsys.readouterr().out == ""
+        dist.ks(verbose=True)
+        assert "KS Test" in capsys.readouterr().out
+
+    def test_ks_after_changing_parameters(
+        self,
+        time_series2: list,
+        dist_estimation_parameters_ks: str,
+        gum_dist_parameters: Dict[str, Dict[str, float]],
+    ):
+        dist = Gumbel(time_series2, gum_dist_parameters["mle"])
+        dist.ks()
+        # the theoretical quantiles shared by the tests are recomputed for the new parameters.
+        dist.parameters = gum_dist_parameters[dist_estimation_parameters_ks]
+        dstatic, pvalue = dist.ks()
+        assert dstatic == 0.07407407407407407
+        assert pvalue == 0.9987375782247235
+
     def test_chisquare(
         self,
         time_series2: list,
@@ -144,7 +281,8 @@ class TestGumbel:
         dist = Gumbel(time_series2, param)
         dstatic, pvalue = dist.chisquare()
         assert dstatic == -0.2813945052127964
-        assert pvalue == 1
+        # the statistic is negative, older scipy versions return a p-value of 1 and newer versions return nan.
+        assert pvalue == 1 or np.isnan(pvalue)
 
     def test_pdf(
         self,
@@ -164,6 +302,18 @@ class TestGumbel:
         assert isinstance(pdf, np.ndarray)
         np.testing.assert_almost_equal(gum_pdf, pdf)
 
+    def test_pdf_broadcast(self, time_series2: list):
+        data = np.asarray(time_series2, dtype=np.float64)
+        loc = np.array([[1400.0], [1500.0], [1600.0]])
+        scale = np.array([[300.0], [400.0], [500.0]])
+        pdf = Gumbel.pdf_broadcast(data, loc, scale)
+        assert pdf.shape == (3, data.size)
+        for i in range(3):
+            expected = Gumbel._pdf_eq(data, {"loc": loc[i, 0], "scale": scale[i, 0]})
+            np.testing.assert_allclose(pdf[i], expected, rtol=1e-14)
+        with pytest.raises(ValueError):
+            Gumbel.pdf_broadcast(data, loc, -scale)
+
     def test_cdf(
         self,
         time_series2: list,
@@ -194,6 +344,11 @@ class TestGumbel:
         qth = dist.inverse_cdf(generated_cdf)
         assert isinstance(qth, np.ndarray)
         np.testing.assert_almost_equal(gev_inverse_cdf, qth)
+        # any probability outside (0, 1] is rejected, not only an all-zero cdf.
+        with pytest.raises(ValueError):
+            dist.inverse_cdf([0.5, 1.2])
+        with pytest.raises(ValueError):
+            dist.inverse_cdf([0.5, -0.1])
 
     def test_confidence_interval(
         self,
@@ -223,6 +378,16 @@ class TestGumbel:
         assert isinstance(fig, Figure)
         assert isinstance(ax, Axes)
 
+        # the bounds can be evaluated at probabilities other than the plotting positions of the data.
+        prob_non_exceed = np.array([0.5, 0.9, 0.99])
+        upper, lower = dist.confidence_interval(
+            prob_non_exceed=prob_non_exceed, alpha=confidence_interval_alpha
+        )
+        assert upper.shape == lower.shape == prob_non_exceed.shape
+        assert np.all(upper > lower)
+        with pytest.raises(ValueError):
+            dist.confidence_interval(prob_non_exceed=prob_non_exceed, plot_figure=True)
+
     def test_plot(
         self,
         time_series2: list,
@@ -243,6 +408,16 @@ class TestGumbel:
         assert isinstance(fig, Figure)
         assert isinstance(ax[0], Axes)
         assert isinstance(ax[1], Axes)
+        # the plotting grid only needs the data range, the data is not sorted.
+        assert dist._data_sorted is None
+        # plotting does not sort the data of the distribution in place.
+        np.testing.assert_array_equal(dist.data, time_series2)
+        # test drawing on existing axes.
+        fig_1, axes = plt.subplots(1, 2)
+        fig, ax = dist.plot(ax=axes)
+        assert fig is fig_1
+        assert ax[0] is axes[0] and ax[1] is axes[1]
+        plt.close(fig_1)
 
 
 class TestGEV:
@@ -271,6 +446,84 @@ class TestGEV:
             assert dist.parameters.get("shape") is not None
             assert param == gev_dist_parameters[method]
 
+    def test_gev_fit_model_mm(self, time_series1: list):
+        dist = GEV(time_series1)
+        param = dist.fit_model(method="mm", test=False)
+        assert all(np.isfinite(list(param.values())))
+        # the moments of the fitted distribution are close to the moments of the data.
+        mean, var = genextreme.stats(
+            param["shape"], loc=param["loc"], scale=param["scale"], moments="mv"
+        )
+        np.testing.assert_allclose(mean, np.mean(time_series1), rtol=1e-3)
+        np.testing.assert_allclose(var, np.var(time_series1), rtol=0.1)
+
+    def test_gev_fit_mle_support(self):
+        # samples where the L-moments start leaves a value outside the support of the distribution.
+        for seed in [45, 110, 183]:
+            rng = np.random.default_rng(seed)
+            shape = rng.uniform(-0.5, 0.5)
+            data = genextreme.rvs(shape, loc=10, scale=2, size=30, random_state=rng)
+            param = GEV(data)._fit_mle()
+            nll = genextreme.nnlf(param, data)
+            assert np.isfinite(nll)
+            assert nll <= genextreme.nnlf(genextreme.fit(data), data) + 1e-6
+        # too few values for the L-moments start, and constant data.
+        for data in [[1.0, 2.0, 4.0], [3.0] * 6]:
+            with np.errstate(all="ignore"):
+                param = GEV(data).fit_model(method="mle", test=False)
+            assert param["scale"] > 0
+        # the method of moments of too few values starts from scipy's default guess.
+        param = GEV([1.0, 2.0, 4.0, 5.0]).fit_model(method="mm", test=False)
+        assert all(np.isfinite(list(param.values())))
+
+    def test_gev_negative_log_likelihood(
+        self,
+        time_series1: list,
+    ):
+        data = np.array(time_series1)
+        for shape in [-0.3, 0.0, 0.2]:
+            param = [shape, 16.4, 0.7]
+            nll, grad = GEV._negative_log_likelihood(param, data)
+            assert nll == pytest.approx(
+                -genextreme.logpdf(data, shape, loc=16.4, scale=0.7).sum()
+            )
+            num_grad = approx_fprime(
+                param, lambda p: GEV._negative_log_likelihood(p, data)[0]
+            )
+            np.testing.assert_allclose(grad, num_grad, rtol=1e-4, atol=1e-4)
+
+    def test_gev_parameter_estimation_optimization(
+        self,
+        time_series1: list,
+    ):
+        dist = GEV(time_series1)
+        param = dist.fit_model(
+            method="optimization",
+            obj_func=GEV.truncated_distribution,
+            threshold=17,
+        )
+        assert isinstance(param, dict)
+        assert all(i in param.keys() for i in ["loc", "scale", "shape"])
+        assert dist.parameters.get("scale") > 0
+        # the threshold is kept at the given value, the fit is the minimum of the truncated likelihood.
+        assert param["loc"] == pytest.approx(16.2651675, rel=1e-6)
+        assert param["scale"] == pytest.approx(0.6382648, rel=1e-5)
+        assert param["shape"] == pytest.approx(-1.0350953, rel=1e-5)
+
+    def test_gev_truncated_nll_grad(
+        self,
+        time_series1: list,
+    ):
+        dist = GEV(time_series1)
+        for param in [[17.0, -0.1, 16.4, 0.7], [16.5, 0.2, 16.0, 0.9]]:
+            split = dist._split_at_threshold(param)
+            nll, grad = GEV._truncated_nll_grad(param, *split)
+            assert nll == pytest.approx(GEV._truncated_nll(param, *split))
+            num_grad = approx_fprime(
+                np.array(param), lambda p: GEV._truncated_nll(p, *split)
+            )
+            np.testing.assert_allclose(grad, num_grad, rtol=1e-4, atol=1e-6)
+
     def test_gev_ks(
         self,
         time_series1: list,
@@ -292,8 +545,43 @@ class TestGEV:
         param = gev_dist_parameters[dist_estimation_parameters_ks]
         dist = GEV(time_series1, param)
         dstatic, pvalue = dist.chisquare()
-        assert dstatic == -22.906818156545253
-        assert pvalue == 1
+        assert dstatic == pytest.approx(-22.906818156545253, rel=1e-12)
+        # the statistic is negative, older scipy versions return a p-value of 1 and newer versions return nan.
+        assert pvalue == 1 or np.isnan(pvalue)
+
+    def test_gev_small_shape(self):
+        """shapes close to zero are evaluated with the Gumbel equations."""
+        x = np.linspace(-3, 8, 50)
+        for shape in [0, 1e-9, -1e-9]:
+            parameters = {"loc": 0.0, "scale": 1.0, "shape": shape}
+            dist = GEV(parameters=parameters)
+            np.testing.assert_allclose(
+                dist.pdf(data=x), genextreme.pdf(x, shape), atol=1e-8
+            )
+            np.testing.assert_allclose(
+                dist.cdf(data=x), genextreme.cdf(x, shape), atol=1e-8
+            )
+
+    def test_gev_pdf_cdf_eq(self):
+        """the fused pdf/cdf evaluation gives the same values as the separate kernels."""
+        x = np.linspace(-10, 30, 200)
+        for shape in [-0.3, 0.0, 0.2]:
+            parameters = {"loc": 1.0, "scale": 2.0, "shape": shape}
+            pdf, cdf = GEV._pdf_cdf_eq(x, parameters)
+            np.testing.assert_allclose(pdf, GEV._pdf_eq(x, parameters), atol=1e-15)
+            np.testing.assert_allclose(cdf, GEV._cdf_eq(x, parameters), atol=1e-15)
+
+    def test_gev_sf_eq(self):
+        data = np.array([-5.0, 0.0, 1.0, 5.0, 40.0, 80.0])
+        for shape in [-0.3, 0.2, 0.0]:
+            parameters = {"loc": 1.0, "scale": 2.0, "shape": shape}
+            sf = GEV._sf_eq(data, parameters)
+            expected = genextreme.sf(data, shape, loc=1.0, scale=2.0)
+            np.testing.assert_allclose(sf, expected, rtol=1e-12, atol=1e-300)
+        # the return period of a value in the far upper tail, where the cdf rounds to 1.
+        dist = GEV(parameters={"loc": 0.0, "scale": 1.0, "shape": -0.1})
+        rp = dist.return_period(dist.parameters, np.array([200.0]))
+        np.testing.assert_allclose(rp, 1 / genextreme.sf(200.0, -0.1), rtol=1e-10)
 
     def test_gev_pdf(
         self,
@@ -417,6 +705,11 @@ class TestExponential:
         assert isinstance(expo_dist.data, np.ndarray)
         assert isinstance(expo_dist.data_sorted, np.ndarray)
 
+    def test_expon_mle(self, time_series1: list):
+        data = np.asarray(time_series1, dtype=np.float64)
+        assert _expon_mle(data) == list(expon.fit(data))
+        assert all(type(i) is float for i in _expon_mle(data))
+
     def test_fit_model(
         self,
         time_series2: list,
@@ -479,6 +772,10 @@ class TestExponential:
         qth = expo_dist.inverse_cdf(generated_cdf)
         assert isinstance(qth, np.ndarray)
         np.testing.assert_almost_equal(exp_inverse_cdf, qth)
+        with pytest.raises(ValueError):
+            expo_dist.inverse_cdf([0.5, 1.2])
+        with pytest.raises(ValueError):
+            expo_dist.inverse_cdf([0.5, -0.1])
 
 
 class TestNormal:
@@ -490,6 +787,11 @@ class TestNormal:
         assert isinstance(norm_dist.data, np.ndarray)
         assert isinstance(norm_dist.data_sorted, np.ndarray)
 
+    def test_norm_mle(self, time_series1: list):
+        data = np.asarray(time_series1, dtype=np.float64)
+        assert _norm_mle(data) == list(norm.fit(data))
+        assert all(type(i) is float for i in _norm_mle(data))
+
     def test_fit_model(
         self,
         time_series2: list,
@@ -505,6 +807,24 @@ class TestNormal:
             assert norm_dist.parameters.get("scale") is not None
             assert param == normal_dist_parameters[method]
 
+    def test_fit_model_test_opt_in(self, time_series2: list, capsys):
+        norm_dist = Normal(time_series2)
+        norm_dist.fit_model(method="mle")
+        assert capsys.readouterr().out == ""
+        norm_dist.fit_model(method="mle", test=True)
+        assert "KS Test" in capsys.readouterr().out
+
+    def test_chisquare_warns_once(self, monkeypatch):
+        # samples rejected by scipy, the standardized sums do not match.
+        norm_dist = Normal(np.random.default_rng(2).gumbel(10, 2, 30))
+        norm_dist.fit_model(method="mle")
+        monkeypatch.setattr(Normal, "_chi_warned", False)
+        with pytest.warns(RuntimeWarning, match="chisquare test failed"):
+            assert norm_dist.chisquare() is None
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert norm_dist.chisquare() is None
+
     def test_pdf(
         self,
         time_series2: list,
@@ -552,6 +872,10 @@ class TestNormal:
         qth = norm_dist.inverse_cdf(generated_cdf)
         assert isinstance(qth, np.ndarray)
         np.testing.assert_almost_equal(normal_inverse_cdf, qth)
+        with pytest.raises(ValueError):
+            norm_dist.inverse_cdf([0.5, 1.2])
+        with pytest.raises(ValueError):
+            norm_dist.inverse_cdf([0.5, -0.1])
 
 
 class TestDistribution: